@@ -745,13 +745,11 @@ def scanner_loop():
             market_games = sports_feed.get_game_data_for_markets(markets)
             live_games_found = sum(1 for g in market_games.values() if g.get('is_live'))
             
-            # 3. Also get general live games as fallback
-            all_games = sports_feed.get_all_live_games()
+            # 3-4. Get general live games as fallback and detect sports
+            # events, both from one fetch of the scoreboards
+            all_games, events, _ = sports_feed.poll()
             total_games = sum(len(g) for g in all_games.values()) + live_games_found
             
-            # 4. Detect sports events
-            events = sports_feed.detect_all_events()
-            
             # 5. Get current prices for position updates
             current_prices = {}
             for market in markets:
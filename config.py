@@ -1,263 +1,531 @@
 """
 Sports Polymarket Quant Trading Bot - Configuration
 
-All configuration values with environment variable overrides.
+All configuration values with environment variable overrides. Values may
+also be set in an optional TOML file (config.toml next to this module, or
+the path in CONFIG_FILE); environment variables take precedence over it.
 """
 
+import functools
+import operator
 import os
+import sys
+import tomllib
+from types import MappingProxyType
 
 
-class Config:
-    """Central configuration for the sports trading bot."""
-    
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))
+
+
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment flag ('true', '1', 'yes' or 'on')."""
+    return value.strip().lower() in _TRUTHY
+
+
+def _env_mode(value: str) -> str:
+    """Case-fold and intern an enum-like setting such as TRADING_MODE."""
+    return sys.intern(value.strip().lower())
+
+
+def _env_csv(value: str) -> tuple:
+    """Parse a comma-separated environment value, dropping empty items."""
+    return tuple(filter(None, (item.strip() for item in value.split(','))))
+
+
+def _env_set(value: str) -> frozenset:
+    """Parse a comma-separated environment value for membership tests."""
+    return frozenset(_env_csv(value))
+
+
+# Setting name -> (typed default, converter for environment overrides).
+# Defaults are plain literals, so they come straight out of the marshalled
+# constants in the compiled module; only variables actually present in the
+# environment are converted at import.
+_SETTINGS = {
     # ═══════════════════════════════════════════════════════════════════
     # TRADING MODE
     # ═══════════════════════════════════════════════════════════════════
-    TRADING_MODE = os.getenv('TRADING_MODE', 'paper')  # 'paper' or 'live'
-    
+    'TRADING_MODE': ('paper', _env_mode),  # 'paper' or 'live'
+
     # ═══════════════════════════════════════════════════════════════════
     # PAPER TRADING
     # ═══════════════════════════════════════════════════════════════════
-    STARTING_BALANCE = float(os.getenv('STARTING_BALANCE', '1000'))
-    
+    'STARTING_BALANCE': (1000.0, float),
+
     # ═══════════════════════════════════════════════════════════════════
     # RISK MANAGEMENT
     # ═══════════════════════════════════════════════════════════════════
-    MAX_POSITION_USD = float(os.getenv('MAX_POSITION_USD', '50'))
-    MAX_DAILY_LOSS_USD = float(os.getenv('MAX_DAILY_LOSS_USD', '100'))
-    MAX_OPEN_POSITIONS = int(os.getenv('MAX_OPEN_POSITIONS', '10'))
-    MAX_HOURLY_TRADES = int(os.getenv('MAX_HOURLY_TRADES', '20'))
-    LOSS_STREAK_PAUSE_LIMIT = int(os.getenv('LOSS_STREAK_PAUSE_LIMIT', '5'))
-    MAX_SLIPPAGE_PERCENT = float(os.getenv('MAX_SLIPPAGE_PERCENT', '2.0'))
-    MIN_LIQUIDITY_USD = float(os.getenv('MIN_LIQUIDITY_USD', '500'))
-    MAX_POSITIONS_PER_EVENT = int(os.getenv('MAX_POSITIONS_PER_EVENT', '2'))
-    
+    'MAX_POSITION_USD': (50.0, float),
+    'MAX_DAILY_LOSS_USD': (100.0, float),
+    'MAX_OPEN_POSITIONS': (10, int),
+    'MAX_HOURLY_TRADES': (20, int),
+    'LOSS_STREAK_PAUSE_LIMIT': (5, int),
+    'MAX_SLIPPAGE_PERCENT': (2.0, float),
+    'MIN_LIQUIDITY_USD': (500.0, float),
+    'MAX_POSITIONS_PER_EVENT': (2, int),
+
     # ═══════════════════════════════════════════════════════════════════
     # STRATEGY TOGGLES
     # ═══════════════════════════════════════════════════════════════════
-    OVERREACTION_FADE_ENABLED = os.getenv('OVERREACTION_FADE_ENABLED', 'true').lower() == 'true'
-    DRAW_DECAY_ENABLED = os.getenv('DRAW_DECAY_ENABLED', 'true').lower() == 'true'
-    RUN_REVERSION_ENABLED = os.getenv('RUN_REVERSION_ENABLED', 'true').lower() == 'true'
-    WICKET_SHOCK_ENABLED = os.getenv('WICKET_SHOCK_ENABLED', 'true').lower() == 'true'
-    FAVORITE_TRAP_ENABLED = os.getenv('FAVORITE_TRAP_ENABLED', 'true').lower() == 'true'
-    VOLATILITY_SCALP_ENABLED = os.getenv('VOLATILITY_SCALP_ENABLED', 'true').lower() == 'true'
-    LAG_ARBITRAGE_ENABLED = os.getenv('LAG_ARBITRAGE_ENABLED', 'true').lower() == 'true'
-    LIQUIDITY_PROVISION_ENABLED = os.getenv('LIQUIDITY_PROVISION_ENABLED', 'true').lower() == 'true'  # Enabled for more trades
-    MARKET_ONLY_ENABLED = os.getenv('MARKET_ONLY_ENABLED', 'true').lower() == 'true'  # Enabled by default!
-    
+    'OVERREACTION_FADE_ENABLED': (True, _env_bool),
+    'DRAW_DECAY_ENABLED': (True, _env_bool),
+    'RUN_REVERSION_ENABLED': (True, _env_bool),
+    'WICKET_SHOCK_ENABLED': (True, _env_bool),
+    'FAVORITE_TRAP_ENABLED': (True, _env_bool),
+    'VOLATILITY_SCALP_ENABLED': (True, _env_bool),
+    'LAG_ARBITRAGE_ENABLED': (True, _env_bool),
+    'LIQUIDITY_PROVISION_ENABLED': (True, _env_bool),  # Enabled for more trades
+    'MARKET_ONLY_ENABLED': (True, _env_bool),  # Enabled by default!
+
     # ═══════════════════════════════════════════════════════════════════
     # SPORT-SPECIFIC PARAMETERS
     # ═══════════════════════════════════════════════════════════════════
     # Football (Soccer)
-    FOOTBALL_FADE_THRESHOLD = float(os.getenv('FOOTBALL_FADE_THRESHOLD', '0.05'))  # 5% move
-    FOOTBALL_DRAW_DECAY_START_MINUTE = int(os.getenv('FOOTBALL_DRAW_DECAY_START_MINUTE', '70'))
-    
+    'FOOTBALL_FADE_THRESHOLD': (0.05, float),  # 5% move
+    'FOOTBALL_DRAW_DECAY_START_MINUTE': (70, int),
+
     # NBA Basketball
-    NBA_RUN_REVERSION_POINTS = int(os.getenv('NBA_RUN_REVERSION_POINTS', '10'))
-    NBA_FOUL_TROUBLE_THRESHOLD = int(os.getenv('NBA_FOUL_TROUBLE_THRESHOLD', '4'))
-    
+    'NBA_RUN_REVERSION_POINTS': (10, int),
+    'NBA_FOUL_TROUBLE_THRESHOLD': (4, int),
+
     # Cricket
-    CRICKET_WICKET_DIP_PERCENT = float(os.getenv('CRICKET_WICKET_DIP_PERCENT', '0.15'))
-    CRICKET_POWERPLAY_BOOST = float(os.getenv('CRICKET_POWERPLAY_BOOST', '1.2'))
-    
+    'CRICKET_WICKET_DIP_PERCENT': (0.15, float),
+    'CRICKET_POWERPLAY_BOOST': (1.2, float),
+
     # Tennis
-    TENNIS_SET_FADE_THRESHOLD = float(os.getenv('TENNIS_SET_FADE_THRESHOLD', '0.10'))
-    
+    'TENNIS_SET_FADE_THRESHOLD': (0.1, float),
+
     # ═══════════════════════════════════════════════════════════════════
     # EXIT PARAMETERS
     # ═══════════════════════════════════════════════════════════════════
-    TAKE_PROFIT_PERCENT = float(os.getenv('TAKE_PROFIT_PERCENT', '8'))  # Tighter take profit
-    STOP_LOSS_PERCENT = float(os.getenv('STOP_LOSS_PERCENT', '5'))  # Tighter stop loss
-    TRAILING_STOP_ENABLED = os.getenv('TRAILING_STOP_ENABLED', 'true').lower() == 'true'
-    TRAILING_STOP_PERCENT = float(os.getenv('TRAILING_STOP_PERCENT', '3'))  # Tighter trailing
-    MAX_HOLD_MINUTES = int(os.getenv('MAX_HOLD_MINUTES', '45'))  # Shorter hold time
-    
+    'TAKE_PROFIT_PERCENT': (8.0, float),  # Tighter take profit
+    'STOP_LOSS_PERCENT': (5.0, float),  # Tighter stop loss
+    'TRAILING_STOP_ENABLED': (True, _env_bool),
+    'TRAILING_STOP_PERCENT': (3.0, float),  # Tighter trailing
+    'MAX_HOLD_MINUTES': (45, int),  # Shorter hold time
+
     # ═══════════════════════════════════════════════════════════════════
     # TELEGRAM ALERTS
     # ═══════════════════════════════════════════════════════════════════
-    TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
-    TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', '')
-    ALERT_ON_ENTRY = os.getenv('ALERT_ON_ENTRY', 'true').lower() == 'true'
-    ALERT_ON_EXIT = os.getenv('ALERT_ON_EXIT', 'true').lower() == 'true'
-    ALERT_ON_SIGNAL = os.getenv('ALERT_ON_SIGNAL', 'true').lower() == 'true'
-    SUMMARY_INTERVAL_HOURS = int(os.getenv('SUMMARY_INTERVAL_HOURS', '4'))
-    
+    'TELEGRAM_BOT_TOKEN': ('', str),
+    'TELEGRAM_CHAT_ID': ('', str),
+    'ALERT_ON_ENTRY': (True, _env_bool),
+    'ALERT_ON_EXIT': (True, _env_bool),
+    'ALERT_ON_SIGNAL': (True, _env_bool),
+    'SUMMARY_INTERVAL_HOURS': (4, int),
+
     # ═══════════════════════════════════════════════════════════════════
     # LIVE TRADING (Future)
     # ═══════════════════════════════════════════════════════════════════
-    POLYGON_WALLET_PRIVATE_KEY = os.getenv('POLYGON_WALLET_PRIVATE_KEY', '')
-    POLYGON_RPC_URL = os.getenv('POLYGON_RPC_URL', 'https://polygon-rpc.com')
-    
+    'POLYGON_WALLET_PRIVATE_KEY': ('', str),
+    'POLYGON_RPC_URL': ('https://polygon-rpc.com', str),
+    'POLYGON_WSS_URL': ('', str),  # Optional: push-based whale monitoring
+
     # ═══════════════════════════════════════════════════════════════════
     # OPTIONAL APIS
     # ═══════════════════════════════════════════════════════════════════
-    ODDS_API_KEY = os.getenv('ODDS_API_KEY', '')
-    SPORTRADAR_API_KEY = os.getenv('SPORTRADAR_API_KEY', '')
-    CRICBUZZ_API_KEY = os.getenv('CRICBUZZ_API_KEY', '')
-    GROQ_API_KEY = os.getenv('GROQ_API_KEY', '')  # FREE! Get key: https://console.groq.com
-    FOOTBALL_DATA_API_KEY = os.getenv('FOOTBALL_DATA_API_KEY', '')  # Free: 10 req/min
-    POLYGONSCAN_API_KEY = os.getenv('POLYGONSCAN_API_KEY', '')  # Optional
-    
+    'ODDS_API_KEY': ('', str),
+    'SPORTRADAR_API_KEY': ('', str),
+    'CRICBUZZ_API_KEY': ('', str),
+    'GROQ_API_KEY': ('', str),  # FREE! Get key: https://console.groq.com
+    'FOOTBALL_DATA_API_KEY': ('', str),  # Free: 10 req/min
+    'POLYGONSCAN_API_KEY': ('', str),  # Optional
+
     # ═══════════════════════════════════════════════════════════════════
     # DYNAMIC ENGINE SETTINGS
     # ═══════════════════════════════════════════════════════════════════
-    CASCADE_ENABLED = os.getenv('CASCADE_ENABLED', 'true').lower() == 'true'
-    CASCADE_THRESHOLD_DECAY = float(os.getenv('CASCADE_THRESHOLD_DECAY', '0.8'))  # 20% reduction per retry
-    CASCADE_MAX_RETRIES = int(os.getenv('CASCADE_MAX_RETRIES', '3'))
-    
+    'CASCADE_ENABLED': (True, _env_bool),
+    'CASCADE_THRESHOLD_DECAY': (0.8, float),  # 20% reduction per retry
+    'CASCADE_MAX_RETRIES': (3, int),
+    'CASCADE_MIN_SIGNALS': (3, int),  # Skip MEDIUM/LOW once CRITICAL/HIGH find this many (0 = never)
+
     # ═══════════════════════════════════════════════════════════════════
     # ARBITRAGE SETTINGS
     # ═══════════════════════════════════════════════════════════════════
-    ARB_ENABLED = os.getenv('ARB_ENABLED', 'true').lower() == 'true'
-    ARB_MIN_EDGE_CENTS = float(os.getenv('ARB_MIN_EDGE_CENTS', '1.5'))
-    ARB_SCAN_RESOLVED = os.getenv('ARB_SCAN_RESOLVED', 'true').lower() == 'true'
-    
+    'ARB_ENABLED': (True, _env_bool),
+    'ARB_MIN_EDGE_CENTS': (1.5, float),
+    'ARB_SCAN_RESOLVED': (True, _env_bool),
+
     # ═══════════════════════════════════════════════════════════════════
     # WHALE TRACKING (works with zero config!)
     # ═══════════════════════════════════════════════════════════════════
-    WHALE_TRACKING_ENABLED = os.getenv('WHALE_TRACKING_ENABLED', 'true').lower() == 'true'
-    WHALE_WALLETS = [w.strip() for w in os.getenv('WHALE_WALLETS', '').split(',') if w.strip()]  # Optional!
-    WHALE_AUTO_DISCOVER = os.getenv('WHALE_AUTO_DISCOVER', 'true').lower() == 'true'  # Find whales automatically
-    WHALE_MIN_TRADE_USD = float(os.getenv('WHALE_MIN_TRADE_USD', '500'))
-    WHALE_MIN_WIN_RATE = float(os.getenv('WHALE_MIN_WIN_RATE', '0.65'))
-    WHALE_COPY_DELAY_SECONDS = int(os.getenv('WHALE_COPY_DELAY_SECONDS', '30'))
-    
+    'WHALE_TRACKING_ENABLED': (True, _env_bool),
+    'WHALE_WALLETS': (frozenset(), _env_set),  # Optional!
+    'WHALE_AUTO_DISCOVER': (True, _env_bool),  # Find whales automatically
+    'WHALE_MIN_TRADE_USD': (500.0, float),
+    'WHALE_MIN_WIN_RATE': (0.65, float),
+    'WHALE_COPY_DELAY_SECONDS': (30, int),
+
     # ═══════════════════════════════════════════════════════════════════
     # ADAPTIVE SYSTEM
     # ═══════════════════════════════════════════════════════════════════
-    ADAPTIVE_ENABLED = os.getenv('ADAPTIVE_ENABLED', 'true').lower() == 'true'
-    ADAPTIVE_LOOKBACK_TRADES = int(os.getenv('ADAPTIVE_LOOKBACK_TRADES', '50'))
-    ADAPTIVE_EMERGENCY_HOURS = int(os.getenv('ADAPTIVE_EMERGENCY_HOURS', '6'))  # Loosen if no trades
-    
+    'ADAPTIVE_ENABLED': (True, _env_bool),
+    'ADAPTIVE_LOOKBACK_TRADES': (50, int),
+    'ADAPTIVE_EMERGENCY_HOURS': (6, int),  # Loosen if no trades
+
     # ═══════════════════════════════════════════════════════════════════
     # DATA SOURCES (all optional!)
     # ═══════════════════════════════════════════════════════════════════
-    USE_WEBSOCKET = os.getenv('USE_WEBSOCKET', 'true').lower() == 'true'
-    WEBSOCKET_FALLBACK_POLL_SECONDS = int(os.getenv('WEBSOCKET_FALLBACK_POLL_SECONDS', '5'))
-    
+    'USE_WEBSOCKET': (True, _env_bool),
+    'WEBSOCKET_FALLBACK_POLL_SECONDS': (5, int),
+
     # ═══════════════════════════════════════════════════════════════════
     # MULTI-SIGNAL ENGINE
     # ═══════════════════════════════════════════════════════════════════
-    MIN_SIGNAL_CONFIDENCE = float(os.getenv('MIN_SIGNAL_CONFIDENCE', '0.5'))  # Relaxed from 0.6
+    'MIN_SIGNAL_CONFIDENCE': (0.5, float),  # Relaxed from 0.6
+
+    'MAX_SIGNALS_PER_SCAN': (5, int),
+    'MAX_CORRELATED_EXPOSURE_USD': (100.0, float),
+    'DIVERSIFICATION_BONUS': (0.1, float),
 
-    MAX_SIGNALS_PER_SCAN = int(os.getenv('MAX_SIGNALS_PER_SCAN', '5'))
-    MAX_CORRELATED_EXPOSURE_USD = float(os.getenv('MAX_CORRELATED_EXPOSURE_USD', '100'))
-    DIVERSIFICATION_BONUS = float(os.getenv('DIVERSIFICATION_BONUS', '0.1'))
-    
     # ═══════════════════════════════════════════════════════════════════
     # FREE SPORTS DATA SOURCES
     # ═══════════════════════════════════════════════════════════════════
     # These are FREE and don't need API keys
-    ESPN_ENABLED = os.getenv('ESPN_ENABLED', 'true').lower() == 'true'
-    FREE_SPORTS_APIS = os.getenv('FREE_SPORTS_APIS', 'true').lower() == 'true'
-    
+    'ESPN_ENABLED': (True, _env_bool),
+    'FREE_SPORTS_APIS': (True, _env_bool),
+
     # ═══════════════════════════════════════════════════════════════════
     # DASHBOARD & DEBUGGING
     # ═══════════════════════════════════════════════════════════════════
-    DASHBOARD_PORT = int(os.getenv('DASHBOARD_PORT', '5000'))
-    DEBUG_MODE = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
-    SCAN_INTERVAL_SECONDS = int(os.getenv('SCAN_INTERVAL_SECONDS', '30'))
-    
-    # ═══════════════════════════════════════════════════════════════════
-    # POLYMARKET API
-    # ═══════════════════════════════════════════════════════════════════
-    POLYMARKET_GAMMA_URL = 'https://gamma-api.polymarket.com'
-    POLYMARKET_CLOB_URL = 'https://clob.polymarket.com'
-    
+    'DASHBOARD_PORT': (5000, int),
+    'DEBUG_MODE': (False, _env_bool),
+    'SCAN_INTERVAL_SECONDS': (30, int),
+
     # ═══════════════════════════════════════════════════════════════════
     # SPORTS MARKET SETTINGS
     # ═══════════════════════════════════════════════════════════════════
-    INCLUDE_UPCOMING_MARKETS = os.getenv('INCLUDE_UPCOMING_MARKETS', 'true').lower() == 'true'
-    UPCOMING_HOURS_AHEAD = int(os.getenv('UPCOMING_HOURS_AHEAD', '24'))
-    PRIORITY_SPORTS = [s.strip() for s in os.getenv('PRIORITY_SPORTS', 'cricket,football,nba,nfl,tennis,ufc').split(',')]
-    FETCH_FUTURES_MARKETS = os.getenv('FETCH_FUTURES_MARKETS', 'true').lower() == 'true'  # Season-long bets
-    
+    'INCLUDE_UPCOMING_MARKETS': (True, _env_bool),
+    'UPCOMING_HOURS_AHEAD': (24, int),
+    'PRIORITY_SPORTS': (('cricket', 'football', 'nba', 'nfl', 'tennis', 'ufc'), _env_csv),
+    'FETCH_FUTURES_MARKETS': (True, _env_bool),  # Season-long bets
+
     # ═══════════════════════════════════════════════════════════════════
     # AGGRESSIVE MODE (NEW!)
     # ═══════════════════════════════════════════════════════════════════
-    AGGRESSIVE_MODE = os.getenv('AGGRESSIVE_MODE', 'false').lower() == 'true'
-    FAVORITE_FLIP_ENABLED = os.getenv('FAVORITE_FLIP_ENABLED', 'false').lower() == 'true'
-    POSITION_SIZE_PERCENT = float(os.getenv('POSITION_SIZE_PERCENT', '10'))
-    USE_KELLY_SIZING = os.getenv('USE_KELLY_SIZING', 'true').lower() == 'true'
-    KELLY_FRACTION = float(os.getenv('KELLY_FRACTION', '0.25'))
-    
+    'AGGRESSIVE_MODE': (False, _env_bool),
+    'FAVORITE_FLIP_ENABLED': (False, _env_bool),
+    'POSITION_SIZE_PERCENT': (10.0, float),
+    'USE_KELLY_SIZING': (True, _env_bool),
+    'KELLY_FRACTION': (0.25, float),
+
     # ═══════════════════════════════════════════════════════════════════
     # ML WHALE COPY (NEW!)
     # ═══════════════════════════════════════════════════════════════════
-    ML_ENABLED = os.getenv('ML_ENABLED', 'true').lower() == 'true'
-    ML_MODEL_PATH = os.getenv('ML_MODEL_PATH', 'models/whale_model.pkl')
-    ML_MIN_CONFIDENCE = float(os.getenv('ML_MIN_CONFIDENCE', '0.6'))
-    ML_AUTO_RETRAIN_SAMPLES = int(os.getenv('ML_AUTO_RETRAIN_SAMPLES', '50'))
-    
+    'ML_ENABLED': (True, _env_bool),
+    'ML_MODEL_PATH': ('models/whale_model.pkl', str),
+    'ML_MIN_CONFIDENCE': (0.6, float),
+    'ML_AUTO_RETRAIN_SAMPLES': (50, int),
+
     # ═══════════════════════════════════════════════════════════════════
     # BLOCKCHAIN MONITORING (NEW!)
     # ═══════════════════════════════════════════════════════════════════
-    BLOCKCHAIN_MONITOR_ENABLED = os.getenv('BLOCKCHAIN_MONITOR_ENABLED', 'false').lower() == 'true'
-    BLOCKCHAIN_POLL_SECONDS = int(os.getenv('BLOCKCHAIN_POLL_SECONDS', '10'))
-    
+    'BLOCKCHAIN_MONITOR_ENABLED': (False, _env_bool),
+    'BLOCKCHAIN_POLL_SECONDS': (10, int),
+
     # ═══════════════════════════════════════════════════════════════════
     # ODDS AGGREGATOR (NEW!)
     # ═══════════════════════════════════════════════════════════════════
-    ODDS_AGGREGATOR_ENABLED = os.getenv('ODDS_AGGREGATOR_ENABLED', 'false').lower() == 'true'
-    ODDS_MIN_EDGE_PERCENT = float(os.getenv('ODDS_MIN_EDGE_PERCENT', '2'))
-    
+    'ODDS_AGGREGATOR_ENABLED': (False, _env_bool),
+    'ODDS_MIN_EDGE_PERCENT': (2.0, float),
+
     # ═══════════════════════════════════════════════════════════════════
     # AI ANALYSIS (NEW!) - Uses Ollama (local) or Groq (cloud, free)
     # ═══════════════════════════════════════════════════════════════════
-    AI_ANALYSIS_ENABLED = os.getenv('AI_ANALYSIS_ENABLED', 'true').lower() == 'true'
-    OLLAMA_URL = os.getenv('OLLAMA_URL', 'http://localhost:11434')
-    OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'llama3.2')
-    AI_FALLBACK_TO_GROQ = os.getenv('AI_FALLBACK_TO_GROQ', 'true').lower() == 'true'
-    AI_CACHE_TTL_SECONDS = int(os.getenv('AI_CACHE_TTL_SECONDS', '300'))
-    
+    'AI_ANALYSIS_ENABLED': (True, _env_bool),
+    'OLLAMA_URL': ('http://localhost:11434', str),
+    'OLLAMA_MODEL': ('llama3.2', str),
+    'AI_FALLBACK_TO_GROQ': (True, _env_bool),
+    'AI_CACHE_TTL_SECONDS': (300, int),
+
     # ═══════════════════════════════════════════════════════════════════
     # ALWAYS-ON STRATEGIES (NEW!) - Work without live events
     # ═══════════════════════════════════════════════════════════════════
-    AI_VALUE_EDGE_ENABLED = os.getenv('AI_VALUE_EDGE_ENABLED', 'true').lower() == 'true'
-    MOMENTUM_STRATEGY_ENABLED = os.getenv('MOMENTUM_STRATEGY_ENABLED', 'true').lower() == 'true'
-    CONTRARIAN_STRATEGY_ENABLED = os.getenv('CONTRARIAN_STRATEGY_ENABLED', 'true').lower() == 'true'
-    
+    'AI_VALUE_EDGE_ENABLED': (True, _env_bool),
+    'MOMENTUM_STRATEGY_ENABLED': (True, _env_bool),
+    'CONTRARIAN_STRATEGY_ENABLED': (True, _env_bool),
+
     # NEW: Over/Under and BTTS strategies
-    OVER_UNDER_STRATEGY_ENABLED = os.getenv('OVER_UNDER_STRATEGY_ENABLED', 'true').lower() == 'true'
-    BTTS_STRATEGY_ENABLED = os.getenv('BTTS_STRATEGY_ENABLED', 'true').lower() == 'true'
-    
+    'OVER_UNDER_STRATEGY_ENABLED': (True, _env_bool),
+    'BTTS_STRATEGY_ENABLED': (True, _env_bool),
+
     # AI Value Edge thresholds (RELAXED)
-    AI_MIN_TRADE_CONFIDENCE = float(os.getenv('AI_MIN_TRADE_CONFIDENCE', '0.5'))  # Was 0.6
-    AI_MIN_EDGE_PERCENT = float(os.getenv('AI_MIN_EDGE_PERCENT', '2.5'))  # Was 3
-    
+    'AI_MIN_TRADE_CONFIDENCE': (0.5, float),  # Was 0.6
+    'AI_MIN_EDGE_PERCENT': (2.5, float),  # Was 3
+
     # Momentum thresholds (RELAXED)
-    MOMENTUM_MIN_STRENGTH = float(os.getenv('MOMENTUM_MIN_STRENGTH', '0.3'))  # Was 0.5
-    
+    'MOMENTUM_MIN_STRENGTH': (0.3, float),  # Was 0.5
+
     # Contrarian thresholds (RELAXED for more trades)
-    CONTRARIAN_MIN_MOVE = float(os.getenv('CONTRARIAN_MIN_MOVE', '0.02'))  # Was 0.04 (2% instead of 4%)
-    
+    'CONTRARIAN_MIN_MOVE': (0.02, float),  # Was 0.04 (2% instead of 4%)
+
     # Over/Under thresholds
-    OVER_UNDER_MIN_CONFIDENCE = float(os.getenv('OVER_UNDER_MIN_CONFIDENCE', '0.55'))
-    OVER_UNDER_MIN_EDGE = float(os.getenv('OVER_UNDER_MIN_EDGE', '0.5'))  # 0.5 goals/points
-    
+    'OVER_UNDER_MIN_CONFIDENCE': (0.55, float),
+    'OVER_UNDER_MIN_EDGE': (0.5, float),  # 0.5 goals/points
+
     # BTTS thresholds
-    BTTS_MIN_CONFIDENCE = float(os.getenv('BTTS_MIN_CONFIDENCE', '0.55'))
-    
+    'BTTS_MIN_CONFIDENCE': (0.55, float),
+
     # ═══════════════════════════════════════════════════════════════════
     # EMERGENCY TRADE MODE (NEW!) - Triggers when no trades for X hours
     # ═══════════════════════════════════════════════════════════════════
-    EMERGENCY_TRADE_MODE_ENABLED = os.getenv('EMERGENCY_TRADE_MODE_ENABLED', 'true').lower() == 'true'
-    EMERGENCY_TRADE_HOURS = int(os.getenv('EMERGENCY_TRADE_HOURS', '6'))  # Activate after 6 hours no trades
-    EMERGENCY_THRESHOLD_MULTIPLIER = float(os.getenv('EMERGENCY_THRESHOLD_MULTIPLIER', '0.5'))  # Halve thresholds
-    
+    'EMERGENCY_TRADE_MODE_ENABLED': (True, _env_bool),
+    'EMERGENCY_TRADE_HOURS': (6, int),  # Activate after 6 hours no trades
+    'EMERGENCY_THRESHOLD_MULTIPLIER': (0.5, float),  # Halve thresholds
+
     # ═══════════════════════════════════════════════════════════════════
     # RELAXED THRESHOLDS (for Market Only strategy - more trades!)
     # ═══════════════════════════════════════════════════════════════════
-    MARKET_ONLY_FAVORITE_THRESHOLD = float(os.getenv('MARKET_ONLY_FAVORITE_THRESHOLD', '0.75'))  # Relaxed from 0.80
-    MARKET_ONLY_UNDERDOG_THRESHOLD = float(os.getenv('MARKET_ONLY_UNDERDOG_THRESHOLD', '0.25'))  # Relaxed from 0.20
-    SPREAD_SCALP_MIN_PERCENT = float(os.getenv('SPREAD_SCALP_MIN_PERCENT', '1.5'))  # Relaxed from 2.0
+    'MARKET_ONLY_FAVORITE_THRESHOLD': (0.75, float),  # Relaxed from 0.80
+    'MARKET_ONLY_UNDERDOG_THRESHOLD': (0.25, float),  # Relaxed from 0.20
+    'SPREAD_SCALP_MIN_PERCENT': (1.5, float),  # Relaxed from 2.0
+}
+
+
+# Toggle setting -> strategy name, in reporting order. Names are interned so
+# strategy routers comparing against them can short-circuit on identity.
+_STRATEGY_TOGGLES = (
+    ('OVERREACTION_FADE_ENABLED', sys.intern('overreaction_fade')),
+    ('DRAW_DECAY_ENABLED', sys.intern('draw_decay')),
+    ('RUN_REVERSION_ENABLED', sys.intern('run_reversion')),
+    ('WICKET_SHOCK_ENABLED', sys.intern('wicket_shock')),
+    ('FAVORITE_TRAP_ENABLED', sys.intern('favorite_trap')),
+    ('VOLATILITY_SCALP_ENABLED', sys.intern('volatility_scalp')),
+    ('LAG_ARBITRAGE_ENABLED', sys.intern('lag_arbitrage')),
+    ('LIQUIDITY_PROVISION_ENABLED', sys.intern('liquidity_provision')),
+)
+
+# Setting name -> inclusive (min, max); None leaves that side open. Checked
+# once at load so trading code can rely on sane values.
+_BOUNDS = {
+    'STARTING_BALANCE': (0, None),
+    'MAX_POSITION_USD': (0, None),
+    'MAX_DAILY_LOSS_USD': (0, None),
+    'MAX_OPEN_POSITIONS': (0, None),
+    'POSITION_SIZE_PERCENT': (0, 100),
+    'MAX_POSITION_PERCENT': (0, 100),
+    'KELLY_FRACTION': (0, 1),
+    'CASCADE_THRESHOLD_DECAY': (0, 1),
+    'CASCADE_MIN_SIGNALS': (0, None),
+    'MIN_SIGNAL_CONFIDENCE': (0, 1),
+    'ML_MIN_CONFIDENCE': (0, 1),
+    'WHALE_MIN_WIN_RATE': (0, 1),
+    'AI_MIN_TRADE_CONFIDENCE': (0, 1),
+    'SCAN_INTERVAL_SECONDS': (1, None),
+}
+
+# Settings whose minimum is itself invalid (a zero Kelly fraction sizes every bet to $0)
+_EXCLUSIVE_MIN = frozenset({'KELLY_FRACTION'})
+
+
+def _check_bounds(values: dict) -> None:
+    """Raise ValueError for any loaded setting outside its allowed range."""
+    for name, (low, high) in _BOUNDS.items():
+        value = values.get(name)
+        if value is None:
+            continue
+        exclusive = name in _EXCLUSIVE_MIN
+        too_low = low is not None and (value <= low if exclusive else value < low)
+        if too_low or (high is not None and value > high):
+            opening = '(' if exclusive else '['
+            raise ValueError(f"{name}={value} is outside the allowed range {opening}{low}, {high}]")
+
+
+# One copy of the environment, shared by every settings class. Reading a
+# plain dict avoids the os.environ proxy; Config.reload() refreshes it.
+_ENV_SNAPSHOT = dict(os.environ)
+
+_DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.toml')
+
+# Setting names declared by every settings class, to spot typos in the config file
+_KNOWN_SETTINGS = set()
+
+
+def _file_mtime(path: str):
+    """Modification time of path in ns, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_settings_file(path: str) -> dict:
+    """Read an optional TOML settings file, flattening its [section] tables."""
+    if _file_mtime(path) is None:
+        return {}
+    with open(path, 'rb') as f:
+        data = tomllib.load(f)
+    values = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            values.update(value)  # [section] tables only group settings
+        else:
+            values[key] = value
+    return values
 
+
+@functools.lru_cache(maxsize=8)
+def _warn_unknown_keys(path: str, file_mtime, names: frozenset) -> None:
+    """Report config file keys no settings class declares (once per file version)."""
+    for name in sorted(names):
+        print(f"⚠️ Unknown setting '{name}' in {path} - ignored")
+
+
+def _coerce(name: str, value, default, convert):
+    """Convert a typed TOML value to the type of the setting's default."""
+    if isinstance(value, str):
+        return convert(value)
+    if type(default) is int and isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{name}={value} must be a whole number")
+    return type(default)(value)
+
+
+def _load(settings: dict, env=None, file_values=None) -> dict:
+    """Resolve settings: environment, then the config file, then defaults."""
+    if env is None:
+        env = os.environ
+    file_values = file_values or {}
+    values = {name: spec[0] for name, spec in settings.items()}
+    # Lookups bound once, so the loops below make plain local calls
+    get_spec = settings.__getitem__
+    get_file = file_values.__getitem__
+    get_env = env.__getitem__
+    # Key-view intersections run in C, so only settings that are actually
+    # overridden reach the Python-level converters.
+    for name in settings.keys() & file_values.keys():
+        default, convert = get_spec(name)
+        values[name] = _coerce(name, get_file(name), default, convert)
+    names = tuple(settings.keys() & env.keys())
+    converters = [get_spec(name)[1] for name in names]
+    values.update(zip(names, map(operator.call, converters, map(get_env, names))))
+    return values
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve(owner, env_items: frozenset, file_path: str, file_mtime) -> MappingProxyType:
+    """Load and validate one settings class, memoized on its inputs.
+    
+    env_items holds only the environment entries the class reads, and
+    file_mtime is part of the key so an edited config file misses the cache.
+    """
+    file_values = _read_settings_file(file_path)
+    unknown = file_values.keys() - _KNOWN_SETTINGS
+    if unknown:
+        _warn_unknown_keys(file_path, file_mtime, frozenset(unknown))
+    values = _load(owner._settings, dict(env_items), file_values)
+    _check_bounds(values)
+    if 'PRIORITY_SPORTS' in values:
+        # Keep the configured order for priority matching, and a
+        # frozenset for O(1) membership tests.
+        values['PRIORITY_SPORTS_ORDER'] = values['PRIORITY_SPORTS']
+        values['PRIORITY_SPORTS'] = frozenset(values['PRIORITY_SPORTS_ORDER'])
+    return MappingProxyType(values)
+
+
+class _Unloaded:
+    """Placeholder for a setting whose class has not loaded yet; reading it loads the class."""
     
+    __slots__ = ('name',)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        owner.from_env()
+        return getattr(owner, self.name)
+
+
+# Attributes from_env() derives from the settings, besides the settings themselves
+_DERIVED_SETTINGS = ('IS_PAPER_MODE', 'ENABLED_STRATEGIES')
 
+
+class _LazySettings(type):
+    """Metaclass that defers loading a settings class until first use.
+    
+    Settings are read-only once loaded; use from_env() to reload them.
+    """
+    
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        # A subclass's own settings must shadow a loaded base's values even
+        # before the subclass loads, so each gets a placeholder in its dict
+        # that from_env() then overwrites.
+        if '_settings' in namespace:
+            _KNOWN_SETTINGS.update(namespace['_settings'])
+            for setting in (*namespace['_settings'], *_DERIVED_SETTINGS):
+                type.__setattr__(cls, setting, _Unloaded(setting))
+    
+    def __setattr__(cls, name, value):
+        if name.isupper():
+            raise AttributeError(f"{cls.__name__}.{name} is read-only; reload it with from_env()")
+        super().__setattr__(name, value)
+
+
+class Config(metaclass=_LazySettings):
+    """Central configuration for the sports trading bot."""
+    
+    _settings = _SETTINGS
+    
+    # ═══════════════════════════════════════════════════════════════════
+    # POLYMARKET API
+    # ═══════════════════════════════════════════════════════════════════
+    POLYMARKET_GAMMA_URL = 'https://gamma-api.polymarket.com'
+    POLYMARKET_CLOB_URL = 'https://clob.polymarket.com'
+    
+    @classmethod
+    def from_env(cls, env=None):
+        """Load every setting from a single snapshot of the environment."""
+        if env is None:
+            env = _ENV_SNAPSHOT
+        # Subclasses only declare the settings they add or override, so the
+        # inherited ones are resolved against the same snapshot first.
+        for base in reversed(cls.__mro__[1:]):
+            if isinstance(base, _LazySettings) and not base.__dict__.get('_loaded'):
+                base.from_env(env)
+        path = env.get('CONFIG_FILE', _DEFAULT_CONFIG_FILE)
+        env_items = frozenset((name, env[name]) for name in cls._settings.keys() & env.keys())
+        values = _resolve(cls, env_items, path, _file_mtime(path))
+        for name, value in values.items():
+            type.__setattr__(cls, name, value)
+        type.__setattr__(cls, 'IS_PAPER_MODE', cls.TRADING_MODE == 'paper')
+        type.__setattr__(cls, 'ENABLED_STRATEGIES', tuple(
+            strategy for flag, strategy in _STRATEGY_TOGGLES if getattr(cls, flag)
+        ))
+        cls._mapping = MappingProxyType({
+            name: getattr(cls, name)
+            for klass in reversed(cls.__mro__) if isinstance(klass, _LazySettings)
+            for name in klass._settings
+        })
+        cls._status_text = None
+        cls._loaded = True
+        return cls
+    
+    @classmethod
+    def reload(cls):
+        """Re-snapshot os.environ and reload every loaded settings class."""
+        global _ENV_SNAPSHOT
+        _ENV_SNAPSHOT = dict(os.environ)
+        # Start from the root so bases reload before the subclasses that
+        # inherit from them.
+        pending = [Config]
+        while pending:
+            klass = pending.pop(0)
+            if klass is Config or klass is cls or klass.__dict__.get('_loaded'):
+                klass.from_env(_ENV_SNAPSHOT)
+            pending.extend(klass.__subclasses__())
+        return cls
+    
+    @classmethod
+    def as_mapping(cls) -> MappingProxyType:
+        """Read-only view of every resolved setting, keyed by name."""
+        if not cls.__dict__.get('_loaded'):
+            cls.from_env()
+        return cls._mapping
+    
     @classmethod
     def is_paper_mode(cls) -> bool:
         """Check if running in paper trading mode."""
-        return cls.TRADING_MODE.lower() == 'paper'
+        return cls.IS_PAPER_MODE
     
     @classmethod
     def is_telegram_configured(cls) -> bool:
@@ -265,41 +533,41 @@ class Config:
         return bool(cls.TELEGRAM_BOT_TOKEN and cls.TELEGRAM_CHAT_ID)
     
     @classmethod
-    def get_enabled_strategies(cls) -> list:
-        """Get list of enabled strategy names."""
-        strategies = []
-        if cls.OVERREACTION_FADE_ENABLED:
-            strategies.append('overreaction_fade')
-        if cls.DRAW_DECAY_ENABLED:
-            strategies.append('draw_decay')
-        if cls.RUN_REVERSION_ENABLED:
-            strategies.append('run_reversion')
-        if cls.WICKET_SHOCK_ENABLED:
-            strategies.append('wicket_shock')
-        if cls.FAVORITE_TRAP_ENABLED:
-            strategies.append('favorite_trap')
-        if cls.VOLATILITY_SCALP_ENABLED:
-            strategies.append('volatility_scalp')
-        if cls.LAG_ARBITRAGE_ENABLED:
-            strategies.append('lag_arbitrage')
-        if cls.LIQUIDITY_PROVISION_ENABLED:
-            strategies.append('liquidity_provision')
-        return strategies
+    def get_enabled_strategies(cls) -> tuple:
+        """Get enabled strategy names (precomputed by from_env)."""
+        return cls.ENABLED_STRATEGIES
+    
+    @classmethod
+    def format_status(cls) -> str:
+        """Build the configuration status banner."""
+        rule = "=" * 60
+        strategies = cls.get_enabled_strategies()
+        mode = 'PAPER' if cls.is_paper_mode() else 'LIVE'
+        telegram = '✅ Configured' if cls.is_telegram_configured() else '⚪ Not configured'
+        lines = [
+            "\n" + rule,
+            "🤖 SPORTS POLYMARKET QUANT BOT - CONFIGURATION",
+            rule,
+            f"\n📊 Mode: {mode} TRADING",
+            f"💰 Starting Balance: ${cls.STARTING_BALANCE:,.2f}",
+            f"📱 Telegram: {telegram}",
+            f"\n🎯 Enabled Strategies ({len(strategies)}):",
+        ]
+        for s in strategies:
+            lines.append(f"   • {s.replace('_', ' ').title()}")
+        lines += [
+            f"\n🛡️ Risk Limits:",
+            f"   • Max position: ${cls.MAX_POSITION_USD}",
+            f"   • Max daily loss: ${cls.MAX_DAILY_LOSS_USD}",
+            f"   • Max open positions: {cls.MAX_OPEN_POSITIONS}",
+            rule + "\n",
+        ]
+        return "\n".join(lines)
     
     @classmethod
     def print_status(cls):
-        """Print configuration status."""
-        print("\n" + "=" * 60)
-        print("🤖 SPORTS POLYMARKET QUANT BOT - CONFIGURATION")
-        print("=" * 60)
-        print(f"\n📊 Mode: {'PAPER' if cls.is_paper_mode() else 'LIVE'} TRADING")
-        print(f"💰 Starting Balance: ${cls.STARTING_BALANCE:,.2f}")
-        print(f"📱 Telegram: {'✅ Configured' if cls.is_telegram_configured() else '⚪ Not configured'}")
-        print(f"\n🎯 Enabled Strategies ({len(cls.get_enabled_strategies())}):")
-        for s in cls.get_enabled_strategies():
-            print(f"   • {s.replace('_', ' ').title()}")
-        print(f"\n🛡️ Risk Limits:")
-        print(f"   • Max position: ${cls.MAX_POSITION_USD}")
-        print(f"   • Max daily loss: ${cls.MAX_DAILY_LOSS_USD}")
-        print(f"   • Max open positions: {cls.MAX_OPEN_POSITIONS}")
-        print("=" * 60 + "\n")
+        """Print configuration status (formatted once per load)."""
+        if cls.__dict__.get('_status_text') is None:
+            cls._status_text = cls.format_status() + "\n"
+        sys.stdout.write(cls._status_text)
+        sys.stdout.flush()
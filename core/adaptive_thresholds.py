@@ -13,9 +13,12 @@ Also implements EMERGENCY MODE:
 
 import sys
 import os
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+import time
+import threading
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from collections import defaultdict, deque
+from itertools import islice
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,14 +29,23 @@ from config import Config
 class StrategyPerformance:
     """Track performance for a single strategy."""
     
-    def __init__(self, strategy_name: str):
+    def __init__(self, strategy_name: str, lookback_trades: int = 50):
         self.strategy_name = strategy_name
-        self.trades = []
+        self.pnls = deque(maxlen=lookback_trades)  # P&L of the most recent trades
+        self.rolling_pnl = 0.0  # Sum of self.pnls, kept incrementally
+        self.rolling_wins = 0  # Winning trades in self.pnls
+        self.last_trade_time = None  # time.monotonic() of the latest trade
         self.wins = 0
         self.losses = 0
         self.total_pnl = 0.0
+        self.total_trades = 0
+        self.trades_since_adjustment = 0
         self.threshold_multiplier = 1.0  # 1.0 = default thresholds
-        self.last_adjusted = datetime.now()
+        self.last_adjusted = time.monotonic()
+        self.last_adjusted_wall = datetime.now()  # For serialization only
+        self._lock = threading.Lock()  # Guards the counters below on update
+        self._dict_cache: Optional[Dict[str, Any]] = None  # Last to_dict() result
+        self._dirty = True
     
     @property
     def win_rate(self) -> float:
@@ -46,51 +58,140 @@ class StrategyPerformance:
     @property
     def avg_pnl(self) -> float:
         """Calculate average P&L per trade."""
-        if not self.trades:
+        if not self.total_trades:
             return 0.0
-        return self.total_pnl / len(self.trades)
+        return self.total_pnl / self.total_trades
     
-    def add_trade(self, pnl: float, timestamp: datetime = None):
-        """Record a completed trade."""
+    def add_trade(self, pnl: float, timestamp: float = None):
+        """Record a completed trade (timestamp on the time.monotonic() clock)."""
         if timestamp is None:
-            timestamp = datetime.now()
-        
-        self.trades.append({'pnl': pnl, 'timestamp': timestamp})
-        self.total_pnl += pnl
-        
-        if pnl > 0:
-            self.wins += 1
-        else:
-            self.losses += 1
+            timestamp = time.monotonic()
+        
+        with self._lock:
+            if len(self.pnls) == self.pnls.maxlen:
+                evicted = self.pnls[0]
+                self.rolling_pnl -= evicted
+                self.rolling_wins -= evicted > 0
+            self.pnls.append(pnl)
+            self.rolling_pnl += pnl
+            self.rolling_wins += pnl > 0
+            self.last_trade_time = timestamp
+            self.total_pnl += pnl
+            self.total_trades += 1
+            self.trades_since_adjustment += 1
+            
+            if pnl > 0:
+                self.wins += 1
+            else:
+                self.losses += 1
+            self._dirty = True
     
     def get_recent_performance(self, lookback_trades: int) -> Dict[str, float]:
         """Get performance over recent N trades."""
-        if not self.trades:
+        if not self.pnls:
             return {'win_rate': 0.0, 'avg_pnl': 0.0, 'total_trades': 0}
         
-        recent_trades = self.trades[-lookback_trades:]
-        wins = sum(1 for t in recent_trades if t['pnl'] > 0)
-        total_pnl = sum(t['pnl'] for t in recent_trades)
+        n = len(self.pnls)
+        if lookback_trades >= n or lookback_trades <= 0:
+            # Whole window: use the incrementally maintained sums
+            wins, total_pnl = self.rolling_wins, self.rolling_pnl
+        else:
+            # Single pass over the tail of the window
+            wins = 0
+            total_pnl = 0.0
+            for pnl in islice(self.pnls, n - lookback_trades, None):
+                total_pnl += pnl
+                if pnl > 0:
+                    wins += 1
+            n = lookback_trades
         
         return {
-            'win_rate': wins / len(recent_trades) if recent_trades else 0.0,
-            'avg_pnl': total_pnl / len(recent_trades) if recent_trades else 0.0,
-            'total_trades': len(recent_trades)
+            'win_rate': wins / n,
+            'avg_pnl': total_pnl / n,
+            'total_trades': n
         }
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
+    def adjust_threshold(self, lookback_trades: int) -> Optional[Dict[str, Any]]:
+        """
+        Move the threshold multiplier based on recent performance.
+        
+        Returns the adjustment log entry, or None if nothing changed.
+        """
+        with self._lock:
+            # Need minimum trades before adjusting
+            if self.total_trades < 10:
+                return None
+            
+            # Don't adjust too frequently (wait at least 5 trades)
+            if self.trades_since_adjustment < 5:
+                return None
+            
+            # Get recent performance
+            recent = self.get_recent_performance(lookback_trades)
+            win_rate = recent['win_rate']
+            avg_pnl = recent['avg_pnl']
+            
+            # Determine adjustment
+            old_multiplier = self.threshold_multiplier
+            
+            # Good performance → loosen thresholds (lower multiplier)
+            if win_rate >= 0.70 and avg_pnl > 0:
+                self.threshold_multiplier = max(0.6, self.threshold_multiplier * 0.9)
+                action = "loosening"
+            
+            # Decent performance → slight loosening
+            elif win_rate >= 0.60 and avg_pnl > 0:
+                self.threshold_multiplier = max(0.8, self.threshold_multiplier * 0.95)
+                action = "slightly loosening"
+            
+            # Poor performance → tighten thresholds (higher multiplier)
+            elif win_rate < 0.45 or avg_pnl < -1.0:
+                self.threshold_multiplier = min(1.5, self.threshold_multiplier * 1.1)
+                action = "tightening"
+            
+            # Mediocre performance → slight tightening
+            elif win_rate < 0.55:
+                self.threshold_multiplier = min(1.2, self.threshold_multiplier * 1.05)
+                action = "slightly tightening"
+            
+            else:
+                # No adjustment needed
+                return None
+            
+            adjusted_at = datetime.now()
+            self.last_adjusted = time.monotonic()
+            self.last_adjusted_wall = adjusted_at
+            self.trades_since_adjustment = 0
+            self._dirty = True
+            new_multiplier = self.threshold_multiplier
+        
         return {
-            'strategy_name': self.strategy_name,
-            'total_trades': len(self.trades),
-            'wins': self.wins,
-            'losses': self.losses,
-            'win_rate': self.win_rate,
-            'total_pnl': self.total_pnl,
-            'avg_pnl': self.avg_pnl,
-            'threshold_multiplier': self.threshold_multiplier,
-            'last_adjusted': self.last_adjusted.isoformat()
+            'timestamp': adjusted_at.isoformat(),
+            'strategy': self.strategy_name,
+            'action': action,
+            'old_multiplier': old_multiplier,
+            'new_multiplier': new_multiplier,
+            'win_rate': win_rate,
+            'avg_pnl': avg_pnl,
+            'trades_analyzed': recent['total_trades']
         }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (re-serialized only after a change)."""
+        if self._dirty or self._dict_cache is None:
+            self._dirty = False
+            self._dict_cache = {
+                'strategy_name': self.strategy_name,
+                'total_trades': self.total_trades,
+                'wins': self.wins,
+                'losses': self.losses,
+                'win_rate': self.win_rate,
+                'total_pnl': self.total_pnl,
+                'avg_pnl': self.avg_pnl,
+                'threshold_multiplier': self.threshold_multiplier,
+                'last_adjusted': self.last_adjusted_wall.isoformat()
+            }
+        return dict(self._dict_cache)
 
 
 class AdaptiveThresholds:
@@ -112,11 +213,29 @@ class AdaptiveThresholds:
         self.lookback_trades = Config.ADAPTIVE_LOOKBACK_TRADES
         self.emergency_hours = Config.ADAPTIVE_EMERGENCY_HOURS
         
-        self.last_trade_time = datetime.now()
+        self.last_trade_time = time.monotonic()
         self.emergency_mode = False
         self.emergency_multiplier = 1.0
         
-        self.adjustment_log = []
+        # Emergency state changes on a scale of hours, so re-evaluate it at
+        # most this often rather than on every multiplier lookup
+        self._emergency_check_interval = 30.0
+        self._next_emergency_check = 0.0
+        self._last_emergency_log_multiplier = 1.0  # Multiplier at the last loosening message
+        
+        # strategy_name -> combined multiplier; cleared whenever a strategy
+        # or the emergency multiplier changes
+        self._multiplier_cache: Dict[str, float] = {}
+        
+        self.adjustment_log = deque(maxlen=1000)  # Most recent adjustments
+        self.total_adjustments = 0
+        
+        # Fine-grained locks: one for inserting new strategies, one for the
+        # log, one for the emergency state and multiplier cache; each
+        # StrategyPerformance carries its own lock
+        self._perf_lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._state_lock = threading.Lock()
         
         print(f"📊 Adaptive Thresholds initialized:")
         print(f"   Lookback window: {self.lookback_trades} trades")
@@ -131,23 +250,37 @@ class AdaptiveThresholds:
             pnl: Profit/loss of the trade
             timestamp: Trade completion time
         """
-        if timestamp is None:
-            timestamp = datetime.now()
-        
-        # Get or create strategy performance tracker
-        if strategy_name not in self.strategy_performance:
-            self.strategy_performance[strategy_name] = StrategyPerformance(strategy_name)
-        
-        perf = self.strategy_performance[strategy_name]
-        perf.add_trade(pnl, timestamp)
-        
-        # Update last trade time
-        self.last_trade_time = timestamp
+        # Monotonic trade time, back-dated for historical trades
+        trade_time = time.monotonic()
+        if timestamp is not None:
+            trade_time -= max(0.0, (datetime.now() - timestamp).total_seconds())
+        
+        # Get or create strategy performance tracker (double-checked)
+        perf = self.strategy_performance.get(strategy_name)
+        if perf is None:
+            with self._perf_lock:
+                perf = self.strategy_performance.get(strategy_name)
+                if perf is None:
+                    perf = StrategyPerformance(strategy_name, self.lookback_trades)
+                    self.strategy_performance[strategy_name] = perf
+        
+        perf.add_trade(pnl, trade_time)
+        
+        with self._state_lock:
+            # Update last trade time
+            self.last_trade_time = trade_time
+            
+            # Exit emergency mode if we got a trade
+            was_emergency = self.emergency_mode
+            if was_emergency:
+                self.emergency_mode = False
+                self.emergency_multiplier = 1.0
+                self._last_emergency_log_multiplier = 1.0
+            
+            # Cleared after the reset, so no lookup re-caches the old state
+            self._multiplier_cache.clear()
         
-        # Exit emergency mode if we got a trade
-        if self.emergency_mode:
-            self.emergency_mode = False
-            self.emergency_multiplier = 1.0
+        if was_emergency:
             print(f"✅ Emergency Mode: Disabled (trade executed)")
         
         # Check if we should adjust thresholds for this strategy
@@ -168,15 +301,35 @@ class AdaptiveThresholds:
         """
         # Check for emergency mode
         self._check_emergency_mode()
+        return self._cached_multiplier(strategy_name)
+    
+    def get_threshold_multipliers(self, strategy_names: List[str]) -> Dict[str, float]:
+        """
+        Get threshold multipliers for several strategies at once.
         
-        # Get strategy-specific multiplier
-        if strategy_name not in self.strategy_performance:
-            strategy_multiplier = 1.0  # Default for new strategies
-        else:
-            strategy_multiplier = self.strategy_performance[strategy_name].threshold_multiplier
-        
-        # Combine with emergency multiplier
-        final_multiplier = strategy_multiplier * self.emergency_multiplier
+        Runs the emergency-mode check once for the whole batch.
+        """
+        self._check_emergency_mode()
+        return {name: self._cached_multiplier(name) for name in strategy_names}
+    
+    def _cached_multiplier(self, strategy_name: str) -> float:
+        """Combined strategy x emergency multiplier, memoized until state changes."""
+        final_multiplier = self._multiplier_cache.get(strategy_name)
+        if final_multiplier is not None:
+            return final_multiplier
+        
+        # Computed and stored under the lock, so a concurrent invalidation
+        # can't be overwritten with a value built from the old state
+        with self._state_lock:
+            # Get strategy-specific multiplier
+            if strategy_name not in self.strategy_performance:
+                strategy_multiplier = 1.0  # Default for new strategies
+            else:
+                strategy_multiplier = self.strategy_performance[strategy_name].threshold_multiplier
+            
+            # Combine with emergency multiplier
+            final_multiplier = strategy_multiplier * self.emergency_multiplier
+            self._multiplier_cache[strategy_name] = final_multiplier
         
         return final_multiplier
     
@@ -190,86 +343,62 @@ class AdaptiveThresholds:
         - Floor of 0.5 (50% of normal thresholds) reached after 10 hours
         - This ensures bot finds opportunities even in slow markets
         """
-        hours_since_trade = (datetime.now() - self.last_trade_time).total_seconds() / 3600
+        now = time.monotonic()
+        if now < self._next_emergency_check:
+            return
+        self._next_emergency_check = now + self._emergency_check_interval
         
-        if hours_since_trade >= self.emergency_hours:
+        activated = loosened = False
+        with self._state_lock:
+            hours_since_trade = (now - self.last_trade_time) / 3600
+            if hours_since_trade < self.emergency_hours:
+                return
+            
             if not self.emergency_mode:
                 self.emergency_mode = True
-                print(f"🚨 Emergency Mode: ACTIVATED (no trades for {hours_since_trade:.1f}h)")
+                activated = True
             
             # Progressive loosening: 5% per hour after threshold, floor at 50%
             hours_over = hours_since_trade - self.emergency_hours
-            self.emergency_multiplier = max(0.5, 1.0 - (0.05 * hours_over))
+            emergency_multiplier = max(0.5, 1.0 - (0.05 * hours_over))
+            if emergency_multiplier != self.emergency_multiplier:
+                self.emergency_multiplier = emergency_multiplier
+                self._multiplier_cache.clear()
             
-            if self.emergency_multiplier < 0.8:
-                print(f"🚨 Emergency Mode: Loosening all thresholds by {(1-self.emergency_multiplier)*100:.0f}%")
+            # Only report loosening once it has moved by another 5%
+            if (emergency_multiplier < 0.8 and
+                    abs(emergency_multiplier - self._last_emergency_log_multiplier) >= 0.05):
+                self._last_emergency_log_multiplier = emergency_multiplier
+                loosened = True
+        
+        if activated:
+            print(f"🚨 Emergency Mode: ACTIVATED (no trades for {hours_since_trade:.1f}h)")
+        if loosened:
+            print(f"🚨 Emergency Mode: Loosening all thresholds by {(1-emergency_multiplier)*100:.0f}%")
     
     def _maybe_adjust_strategy(self, strategy_name: str):
         """
         Check if strategy thresholds should be adjusted based on performance.
         Only adjusts after minimum number of trades.
         """
-        perf = self.strategy_performance[strategy_name]
-        
-        # Need minimum trades before adjusting
-        if len(perf.trades) < 10:
-            return
-        
-        # Don't adjust too frequently (wait at least 5 trades)
-        trades_since_adjustment = len([t for t in perf.trades 
-                                       if t['timestamp'] > perf.last_adjusted])
-        if trades_since_adjustment < 5:
+        adjustment = self.strategy_performance[strategy_name].adjust_threshold(self.lookback_trades)
+        if adjustment is None:
             return
         
-        # Get recent performance
-        recent = perf.get_recent_performance(self.lookback_trades)
-        win_rate = recent['win_rate']
-        avg_pnl = recent['avg_pnl']
-        
-        # Determine adjustment
-        old_multiplier = perf.threshold_multiplier
-        
-        # Good performance → loosen thresholds (lower multiplier)
-        if win_rate >= 0.70 and avg_pnl > 0:
-            perf.threshold_multiplier = max(0.6, perf.threshold_multiplier * 0.9)
-            action = "loosening"
-        
-        # Decent performance → slight loosening
-        elif win_rate >= 0.60 and avg_pnl > 0:
-            perf.threshold_multiplier = max(0.8, perf.threshold_multiplier * 0.95)
-            action = "slightly loosening"
-        
-        # Poor performance → tighten thresholds (higher multiplier)
-        elif win_rate < 0.45 or avg_pnl < -1.0:
-            perf.threshold_multiplier = min(1.5, perf.threshold_multiplier * 1.1)
-            action = "tightening"
-        
-        # Mediocre performance → slight tightening
-        elif win_rate < 0.55:
-            perf.threshold_multiplier = min(1.2, perf.threshold_multiplier * 1.05)
-            action = "slightly tightening"
-        
-        else:
-            # No adjustment needed
-            return
+        with self._state_lock:
+            self._multiplier_cache.clear()
         
         # Log adjustment
-        perf.last_adjusted = datetime.now()
-        
-        adjustment = {
-            'timestamp': datetime.now().isoformat(),
-            'strategy': strategy_name,
-            'action': action,
-            'old_multiplier': old_multiplier,
-            'new_multiplier': perf.threshold_multiplier,
-            'win_rate': win_rate,
-            'avg_pnl': avg_pnl,
-            'trades_analyzed': recent['total_trades']
-        }
-        self.adjustment_log.append(adjustment)
+        action = adjustment['action']
+        win_rate = adjustment['win_rate']
+        old_multiplier = adjustment['old_multiplier']
+        new_multiplier = adjustment['new_multiplier']
+        with self._log_lock:
+            self.adjustment_log.append(adjustment)
+            self.total_adjustments += 1
         
         print(f"📊 Adaptive: {action} '{strategy_name}' thresholds "
-              f"(win rate: {win_rate*100:.0f}%, multiplier: {old_multiplier:.2f} → {perf.threshold_multiplier:.2f})")
+              f"(win rate: {win_rate*100:.0f}%, multiplier: {old_multiplier:.2f} → {new_multiplier:.2f})")
     
     def get_strategy_stats(self) -> Dict[str, Any]:
         """Get statistics for all strategies."""
@@ -280,17 +409,23 @@ class AdaptiveThresholds:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get adaptive system statistics."""
-        hours_since_trade = (datetime.now() - self.last_trade_time).total_seconds() / 3600
+        hours_since_trade = (time.monotonic() - self.last_trade_time) / 3600
         
         return {
             'emergency_mode': self.emergency_mode,
             'emergency_multiplier': self.emergency_multiplier,
             'hours_since_trade': hours_since_trade,
             'strategies_tracked': len(self.strategy_performance),
-            'total_adjustments': len(self.adjustment_log),
-            'recent_adjustments': self.adjustment_log[-5:] if self.adjustment_log else []
+            'total_adjustments': self.total_adjustments,
+            'recent_adjustments': self._recent_adjustments(5)
         }
     
     def get_adjustment_log(self, limit: int = 50) -> list:
         """Get recent threshold adjustments."""
-        return self.adjustment_log[-limit:] if self.adjustment_log else []
+        return self._recent_adjustments(limit)
+    
+    def _recent_adjustments(self, limit: int) -> list:
+        """Copy the last `limit` log entries without materializing the whole deque."""
+        with self._log_lock:
+            start = max(0, len(self.adjustment_log) - limit)
+            return list(islice(self.adjustment_log, start, None))
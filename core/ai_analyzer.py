@@ -15,8 +15,14 @@ Analyzes markets for:
 import os
 import sys
 import json
+import atexit
+import time
+import threading
 import httpx
+import numpy as np
 from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
@@ -26,6 +32,71 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import Config
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+GROQ_API_URL = "https://api.groq.com"
+GROQ_CHAT_PATH = "/openai/v1/chat/completions"
+
+# Markets analyzed at once by analyze_markets when an LLM is in use
+LLM_CONCURRENCY = 8
+
+# Categorical market fields encoded for the vectorized heuristics
+_MOMENTUM_CODES = {'bullish': 1, 'bearish': -1}
+_EXTREME_CODES = {'high': 1, 'low': -1}
+_DIRECTIONS = {1: 'buy_yes', -1: 'buy_no', 0: 'hold'}
+
+_PROMPT_TEMPLATE = """Analyze this sports betting market for trading opportunities:
+
+MARKET: {question}
+SPORT: {sport}
+CURRENT PRICE: ${price:.2f} (YES outcome)
+PREVIOUS PRICE: {prev_price}
+MOMENTUM: {momentum}
+
+Return only a JSON object with no surrounding text:
+{{
+    "edge_detected": true/false,
+    "direction": "buy_yes" or "buy_no" or "hold",
+    "confidence": 0.0-1.0,
+    "fair_value": 0.0-1.0,
+    "rationale": "brief reason"
+}}
+
+Consider:
+1. Is the current price likely mispriced?
+2. Is there momentum to exploit?
+3. Are the odds fair for this market?
+"""
+
+_BATCH_MARKET_LINE = (
+    "[{index}] MARKET: {question} | SPORT: {sport} | CURRENT PRICE: ${price:.2f} (YES) | "
+    "PREVIOUS PRICE: {prev_price} | MOMENTUM: {momentum}"
+)
+
+_BATCH_PROMPT_TEMPLATE = """Analyze the following {count} sports betting markets for trading opportunities:
+
+{markets}
+
+Return only a JSON array with one object per market and no surrounding text:
+[
+    {{
+        "market_index": 0,
+        "edge_detected": true/false,
+        "direction": "buy_yes" or "buy_no" or "hold",
+        "confidence": 0.0-1.0,
+        "fair_value": 0.0-1.0,
+        "rationale": "brief reason"
+    }}
+]
+"""
+
+GROQ_BATCH_SIZE = 10  # Markets packed into one Groq request
+
 
 class AIProvider(Enum):
     """Available AI providers."""
@@ -34,7 +105,7 @@ class AIProvider(Enum):
     HEURISTICS = 'heuristics'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AIAnalysis:
     """Result of AI market analysis."""
     market_id: str
@@ -69,8 +140,27 @@ class AIAnalyzer:
         # Stats
         self.calls_by_provider = {p: 0 for p in AIProvider}
         self.total_analyses = 0
-        self.cache = {}  # market_id -> (timestamp, analysis)
+        self.cache: OrderedDict[str, Tuple[datetime, AIAnalysis]] = OrderedDict()  # LRU order
         self.cache_ttl_seconds = 300  # 5 minutes
+        self.cache_max = 4096
+        
+        # Ollama failure backoff (seconds, doubles per failure up to 5 min)
+        self._ollama_backoff = 1.0
+        self._ollama_next_try = 0.0
+        
+        # analyze_markets runs markets on this pool; the lock guards the
+        # cache, stats and backoff state they share
+        self._llm_pool = ThreadPoolExecutor(max_workers=LLM_CONCURRENCY, thread_name_prefix='ai-analyze')
+        self._lock = threading.Lock()
+        
+        # Long-lived clients so keep-alive and connection pooling apply
+        self._ollama_client = httpx.Client(base_url=self.ollama_url, timeout=30.0)
+        self._groq_client = httpx.Client(
+            base_url=GROQ_API_URL,
+            timeout=15.0,
+            headers=self._groq_headers()
+        ) if self.groq_key else None
+        atexit.register(self.close)
         
         # Check Ollama availability
         self._check_ollama()
@@ -78,39 +168,91 @@ class AIAnalyzer:
     def _check_ollama(self) -> None:
         """Check if Ollama is running and accessible."""
         try:
-            with httpx.Client(timeout=2.0) as client:
-                response = client.get(f"{self.ollama_url}/api/tags")
-                self.ollama_available = response.status_code == 200
-                if self.ollama_available:
-                    print(f"✅ Ollama connected at {self.ollama_url}")
+            response = self._ollama_client.get("/api/tags", timeout=2.0)
+            self.ollama_available = response.status_code == 200
+            if self.ollama_available:
+                print(f"✅ Ollama connected at {self.ollama_url}")
         except Exception:
             self.ollama_available = False
             print(f"⚠️ Ollama not available at {self.ollama_url} - will use fallbacks")
     
-    def analyze_market(self, market: Dict) -> Optional[AIAnalysis]:
+    def _ollama_failed(self) -> None:
+        """Skip Ollama for an exponentially growing window after a failure."""
+        with self._lock:
+            self._ollama_next_try = time.monotonic() + self._ollama_backoff
+            self._ollama_backoff = min(self._ollama_backoff * 2, 300.0)
+    
+    def _count(self, provider: Optional[AIProvider] = None, calls: int = 1, analyses: int = 0) -> None:
+        """Add to the provider call and analysis counters."""
+        with self._lock:
+            if provider is not None:
+                self.calls_by_provider[provider] += calls
+            self.total_analyses += analyses
+    
+    def close(self) -> None:
+        """Close the analysis pool and the pooled HTTP clients."""
+        self._llm_pool.shutdown(wait=False)
+        self._ollama_client.close()
+        if self._groq_client is not None:
+            self._groq_client.close()
+    
+    def _cache_get(self, market_id: str, now: datetime) -> Optional[AIAnalysis]:
+        """Return a fresh cached analysis, dropping it if expired."""
+        with self._lock:
+            entry = self.cache.get(market_id)
+            if entry is None:
+                return None
+            timestamp, cached = entry
+            if (now - timestamp).total_seconds() >= self.cache_ttl_seconds:
+                del self.cache[market_id]
+                return None
+            self.cache.move_to_end(market_id)
+            return cached
+    
+    def _cache_put(self, market_id: str, analysis: AIAnalysis, now: datetime) -> None:
+        """Store an analysis, evicting the least recently used entry when full."""
+        with self._lock:
+            self.cache[market_id] = (now, analysis)
+            self.cache.move_to_end(market_id)
+            if len(self.cache) > self.cache_max:
+                self.cache.popitem(last=False)
+    
+    @staticmethod
+    def _worth_llm(market: Dict) -> bool:
+        """Whether a market is interesting enough to spend an LLM call on."""
+        price = market.get('current_price', 0.5)
+        return bool(
+            price >= 0.85 or price <= 0.18 or
+            market.get('price_change') or
+            market.get('momentum_direction') in ('bullish', 'bearish')
+        )
+    
+    def analyze_market(self, market: Dict, require_llm: bool = False) -> Optional[AIAnalysis]:
         """
         Analyze a market with AI.
         
-        Tries providers in order until one succeeds.
+        Tries providers in order until one succeeds. Markets that fail the
+        _worth_llm gate go straight to heuristics unless require_llm is set.
         """
         market_id = market.get('id', '')
         
-        # Check cache
-        if market_id in self.cache:
-            timestamp, cached = self.cache[market_id]
-            age = (datetime.now() - timestamp).seconds
-            if age < self.cache_ttl_seconds:
-                return cached
+        now = datetime.now()
         
-        analysis = None
+        # Check cache (a forced LLM run ignores cached heuristic results)
+        cached = self._cache_get(market_id, now)
+        if cached is not None and not (require_llm and cached.provider == AIProvider.HEURISTICS):
+            return cached
         
-        # Try Ollama first
-        if self.ollama_available:
-            analysis = self._analyze_with_ollama(market)
+        analysis = None
         
-        # Fallback to Groq
-        if not analysis and self.groq_available:
-            analysis = self._analyze_with_groq(market)
+        if require_llm or self._worth_llm(market):
+            # Try Ollama first
+            if self.ollama_available:
+                analysis = self._analyze_with_ollama(market)
+            
+            # Fallback to Groq
+            if not analysis and self.groq_available:
+                analysis = self._analyze_with_groq(market)
         
         # Fallback to heuristics
         if not analysis:
@@ -118,38 +260,80 @@ class AIAnalyzer:
         
         # Cache result
         if analysis and market_id:
-            self.cache[market_id] = (datetime.now(), analysis)
+            self._cache_put(market_id, analysis, now)
         
-        self.total_analyses += 1
+        self._count(analyses=1)
         return analysis
     
+    def deep_analyze(self, market: Dict) -> Optional[AIAnalysis]:
+        """Analyze a market with the LLM providers regardless of the gate."""
+        return self.analyze_market(market, require_llm=True)
+    
+    def _ollama_payload(self, prompt: str) -> Dict:
+        """Request body for an Ollama generate call."""
+        return {
+            "model": self.ollama_model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {"temperature": 0.3}
+        }
+    
+    def _groq_headers(self) -> Dict:
+        """Request headers for the Groq API."""
+        return {
+            "Authorization": f"Bearer {self.groq_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def _groq_payload(self, prompt: str, max_tokens: int = 500) -> Dict:
+        """Request body for a Groq chat completion."""
+        return {
+            "model": "llama-3.1-8b-instant",
+            "messages": [
+                {"role": "system", "content": "You are a sports betting market analyst. Respond with JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3,
+            "max_tokens": max_tokens
+        }
+    
+    @staticmethod
+    def _groq_content(result: Dict) -> str:
+        """Extract the message text from a Groq chat completion."""
+        return result.get('choices', [{}])[0].get('message', {}).get('content', '')
+    
     def _analyze_with_ollama(self, market: Dict) -> Optional[AIAnalysis]:
         """Analyze market using local Ollama."""
+        if time.monotonic() < self._ollama_next_try:
+            return None  # Backing off after a recent failure
+        
         try:
             prompt = self._build_analysis_prompt(market)
             
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": self.ollama_model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {"temperature": 0.3}
-                    }
+            response = self._ollama_client.post(
+                "/api/generate",
+                json=self._ollama_payload(prompt)
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                analysis = self._parse_ai_response(
+                    market, 
+                    result.get('response', ''),
+                    AIProvider.OLLAMA
                 )
+                with self._lock:
+                    self._ollama_backoff = 1.0
+                self._count(AIProvider.OLLAMA)
+                return analysis
+            
+            # Overloaded or missing model - back off as for a network error
+            self._ollama_failed()
+            if Config.DEBUG_MODE:
+                print(f"⚠️ Ollama returned HTTP {response.status_code}")
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    analysis = self._parse_ai_response(
-                        market, 
-                        result.get('response', ''),
-                        AIProvider.OLLAMA
-                    )
-                    self.calls_by_provider[AIProvider.OLLAMA] += 1
-                    return analysis
-                    
         except Exception as e:
+            self._ollama_failed()
             print(f"⚠️ Ollama analysis failed: {e}")
         
         return None
@@ -159,40 +343,94 @@ class AIAnalyzer:
         try:
             prompt = self._build_analysis_prompt(market)
             
-            with httpx.Client(timeout=15.0) as client:
-                response = client.post(
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.groq_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "llama-3.1-8b-instant",
-                        "messages": [
-                            {"role": "system", "content": "You are a sports betting market analyst. Respond with JSON only."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "temperature": 0.3,
-                        "max_tokens": 500
-                    }
+            response = self._groq_client.post(
+                GROQ_CHAT_PATH,
+                json=self._groq_payload(prompt)
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                content = self._groq_content(result)
+                analysis = self._parse_ai_response(
+                    market,
+                    content,
+                    AIProvider.GROQ
                 )
+                self._count(AIProvider.GROQ)
+                return analysis
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result.get('choices', [{}])[0].get('message', {}).get('content', '')
-                    analysis = self._parse_ai_response(
-                        market,
-                        content,
-                        AIProvider.GROQ
-                    )
-                    self.calls_by_provider[AIProvider.GROQ] += 1
-                    return analysis
-                    
         except Exception as e:
             print(f"⚠️ Groq analysis failed: {e}")
         
         return None
     
+    # ═══════════════════════════════════════════════════════════════════
+    # GROQ BATCHING (several markets per request)
+    # ═══════════════════════════════════════════════════════════════════
+    
+    def _split_cached(self, markets: List[Dict], now: datetime) -> Tuple[List[AIAnalysis], List[Dict]]:
+        """Separate markets with a fresh cached analysis from those still to analyze."""
+        cached_analyses = []
+        pending = []
+        for market in markets:
+            cached = self._cache_get(market.get('id', ''), now)
+            if cached is not None:
+                cached_analyses.append(cached)
+            else:
+                pending.append(market)
+        return cached_analyses, pending
+    
+    def _collect_batch(self, chunk: List[Dict], results: Optional[List[Optional[AIAnalysis]]],
+                       now: datetime) -> Tuple[List[AIAnalysis], List[Dict]]:
+        """Cache and count batch results; return them plus the markets left unanswered."""
+        if results is None:
+            return [], chunk
+        
+        found = []
+        missing = []
+        for market, analysis in zip(chunk, results):
+            if analysis is None:
+                missing.append(market)
+                continue
+            market_id = market.get('id', '')
+            if market_id:
+                self._cache_put(market_id, analysis, now)
+            found.append(analysis)
+        
+        self._count(AIProvider.GROQ, len(found), len(found))
+        return found, missing
+    
+    def _analyze_batch_with_groq(self, markets: List[Dict]) -> List[AIAnalysis]:
+        """
+        Analyze markets with one Groq request per GROQ_BATCH_SIZE markets.
+        
+        Markets the batch could not answer fall back to analyze_market.
+        """
+        now = datetime.now()
+        analyses, pending = self._split_cached(markets, now)
+        
+        for start in range(0, len(pending), GROQ_BATCH_SIZE):
+            chunk = pending[start:start + GROQ_BATCH_SIZE]
+            results = None
+            try:
+                response = self._groq_client.post(
+                    GROQ_CHAT_PATH,
+                    json=self._groq_payload(self._build_batch_prompt(chunk), max_tokens=150 * len(chunk)),
+                    timeout=30.0
+                )
+                if response.status_code == 200:
+                    results = self._parse_batch_response(
+                        chunk, self._groq_content(response.json()), AIProvider.GROQ
+                    )
+            except Exception as e:
+                print(f"⚠️ Groq batch analysis failed: {e}")
+            
+            found, missing = self._collect_batch(chunk, results, now)
+            analyses.extend(found)
+            analyses.extend(self.analyze_market(m) for m in missing)
+        
+        return analyses
+    
     def _analyze_with_heuristics(self, market: Dict) -> AIAnalysis:
         """
         Analyze market using simple heuristics.
@@ -264,7 +502,7 @@ class AIAnalyzer:
                 confidence = min(confidence + 0.1, 0.7)
                 rationale_parts.append(f"Sharp downward move ({price_change*100:.1f}%)")
         
-        self.calls_by_provider[AIProvider.HEURISTICS] += 1
+        self._count(AIProvider.HEURISTICS)
         
         return AIAnalysis(
             market_id=market_id,
@@ -277,86 +515,236 @@ class AIAnalyzer:
             timestamp=datetime.now()
         )
     
+    def analyze_markets_batch(self, markets: List[Dict]) -> List[AIAnalysis]:
+        """
+        Run the heuristic rules over many markets at once.
+        
+        Mirrors _analyze_with_heuristics rule for rule using NumPy masks,
+        and only wraps markets with an edge into AIAnalysis objects.
+        """
+        n = len(markets)
+        if n == 0:
+            return []
+        
+        price = np.fromiter((m.get('current_price', 0.5) for m in markets), dtype=np.float64, count=n)
+        momentum = np.fromiter((_MOMENTUM_CODES.get(m.get('momentum_direction'), 0) for m in markets),
+                               dtype=np.int8, count=n)
+        extreme = np.fromiter((_EXTREME_CODES.get(m.get('price_extreme'), 0) for m in markets),
+                              dtype=np.int8, count=n)
+        change = np.fromiter((m.get('price_change') or 0.0 for m in markets), dtype=np.float64, count=n)
+        
+        # Rule 1: Extreme prices often mean value
+        favorite = price >= 0.88
+        underdog = ~favorite & (price <= 0.15)
+        edge = favorite | underdog
+        direction = np.select([favorite, underdog], [-1, 1], 0)
+        confidence = np.select([favorite, underdog], [0.55, 0.5], 0.3)
+        fair_value = np.select([favorite, underdog], [price - 0.05, price + 0.03], 0.5)
+        
+        # Rule 2: Momentum
+        bullish = (momentum == 1) & (price < 0.7)
+        bearish = ~bullish & (momentum == -1) & (price > 0.3)
+        rule2 = bullish | bearish
+        edge |= rule2
+        direction = np.select([bullish, bearish], [1, -1], direction)
+        confidence = np.where(rule2, np.minimum(confidence + 0.15, 0.75), confidence)
+        
+        # Rule 3: Recent price extreme (contrarian, does not flag an edge)
+        at_high = (extreme == 1) & (price < 0.85)
+        at_low = ~at_high & (extreme == -1) & (price > 0.15)
+        rule3 = at_high | at_low
+        direction = np.select([at_high, at_low], [-1, 1], direction)
+        confidence = np.where(rule3, np.minimum(confidence + 0.1, 0.7), confidence)
+        
+        # Rule 4: Price change based edge
+        sharp = np.abs(change) > 0.03
+        edge |= sharp
+        move_up = sharp & (change > 0) & (price < 0.8)
+        move_down = sharp & (change < 0) & (price > 0.2)
+        rule4 = move_up | move_down
+        direction = np.select([move_up, move_down], [1, -1], direction)
+        confidence = np.where(rule4, np.minimum(confidence + 0.1, 0.7), confidence)
+        
+        self._count(AIProvider.HEURISTICS, n, n)
+        
+        now = datetime.now()
+        analyses = []
+        for i in np.flatnonzero(edge).tolist():
+            rationale_parts = []
+            if favorite[i]:
+                rationale_parts.append("High favorite may be overvalued")
+            elif underdog[i]:
+                rationale_parts.append("Extreme underdog may have value")
+            if bullish[i]:
+                rationale_parts.append("Bullish momentum detected")
+            elif bearish[i]:
+                rationale_parts.append("Bearish momentum detected")
+            if at_high[i]:
+                rationale_parts.append("Price at recent high - potential fade")
+            elif at_low[i]:
+                rationale_parts.append("Price at recent low - potential bounce")
+            if move_up[i]:
+                rationale_parts.append(f"Sharp upward move (+{change[i]*100:.1f}%)")
+            elif move_down[i]:
+                rationale_parts.append(f"Sharp downward move ({change[i]*100:.1f}%)")
+            
+            analyses.append(AIAnalysis(
+                market_id=markets[i].get('id', ''),
+                provider=AIProvider.HEURISTICS,
+                confidence=float(confidence[i]),
+                edge_detected=True,
+                suggested_direction=_DIRECTIONS[int(direction[i])],
+                fair_value_estimate=float(fair_value[i]),
+                rationale="; ".join(rationale_parts) if rationale_parts else "Standard market conditions",
+                timestamp=now
+            ))
+        return analyses
+    
+    @staticmethod
+    def _prompt_fields(market: Dict) -> Dict:
+        """Market fields interpolated into the prompt templates."""
+        prev_price = market.get('previous_price')
+        return {
+            'question': market.get('question', 'Unknown market'),
+            'sport': market.get('sport', 'unknown'),
+            'price': market.get('current_price', 0.5),
+            'prev_price': f"${prev_price:.2f}" if prev_price is not None else "N/A",
+            'momentum': market.get('momentum_direction', 'unknown'),
+        }
+    
     def _build_analysis_prompt(self, market: Dict) -> str:
         """Build prompt for AI analysis."""
-        question = market.get('question', 'Unknown market')
-        price = market.get('current_price', 0.5)
-        sport = market.get('sport', 'unknown')
-        prev_price = market.get('previous_price')
-        momentum = market.get('momentum_direction', 'unknown')
-        
-        return f"""Analyze this sports betting market for trading opportunities:
-
-MARKET: {question}
-SPORT: {sport}
-CURRENT PRICE: ${price:.2f} (YES outcome)
-PREVIOUS PRICE: ${prev_price:.2f if prev_price else 'N/A'}
-MOMENTUM: {momentum}
-
-Respond in JSON format only:
-{{
-    "edge_detected": true/false,
-    "direction": "buy_yes" or "buy_no" or "hold",
-    "confidence": 0.0-1.0,
-    "fair_value": 0.0-1.0,
-    "rationale": "brief reason"
-}}
-
-Consider:
-1. Is the current price likely mispriced?
-2. Is there momentum to exploit?
-3. Are the odds fair for this market?
-"""
+        return _PROMPT_TEMPLATE.format_map(self._prompt_fields(market))
+    
+    def _build_batch_prompt(self, markets: List[Dict]) -> str:
+        """Build one prompt covering several markets, indexed from 0."""
+        lines = []
+        for index, market in enumerate(markets):
+            fields = self._prompt_fields(market)
+            fields['index'] = index
+            lines.append(_BATCH_MARKET_LINE.format_map(fields))
+        return _BATCH_PROMPT_TEMPLATE.format_map({'count': len(markets), 'markets': "\n".join(lines)})
     
     def _parse_ai_response(self, market: Dict, response: str, provider: AIProvider) -> Optional[AIAnalysis]:
         """Parse AI response into AIAnalysis object."""
         try:
-            # Try to extract JSON from response
-            # Handle responses that might have text before/after JSON
-            json_start = response.find('{')
-            json_end = response.rfind('}') + 1
+            # Fast path: the model returned a bare JSON object
+            try:
+                data = _json_loads(response)
+            except ValueError:
+                data = None
             
-            if json_start >= 0 and json_end > json_start:
-                json_str = response[json_start:json_end]
-                data = json.loads(json_str)
-                
-                return AIAnalysis(
-                    market_id=market.get('id', ''),
-                    provider=provider,
-                    confidence=float(data.get('confidence', 0.5)),
-                    edge_detected=bool(data.get('edge_detected', False)),
-                    suggested_direction=data.get('direction', 'hold'),
-                    fair_value_estimate=float(data.get('fair_value', 0.5)) if data.get('fair_value') else None,
-                    rationale=data.get('rationale', 'AI analysis'),
-                    timestamp=datetime.now()
-                )
+            if not isinstance(data, dict):
+                # Handle responses that might have text before/after JSON
+                json_start = response.find('{')
+                json_end = response.rfind('}') + 1
+                if json_start < 0 or json_end <= json_start:
+                    return None
+                data = _json_loads(response[json_start:json_end])
+            
+            return self._analysis_from_data(market, data, provider)
         except Exception as e:
             print(f"⚠️ Failed to parse AI response: {e}")
         
         return None
     
-    def analyze_markets(self, markets: List[Dict], top_n: int = 10) -> List[AIAnalysis]:
+    def _analysis_from_data(self, market: Dict, data: Dict, provider: AIProvider) -> AIAnalysis:
+        """Build an AIAnalysis from one decoded JSON analysis object."""
+        fair_value = data.get('fair_value')
+        return AIAnalysis(
+            market_id=market.get('id', ''),
+            provider=provider,
+            confidence=float(data.get('confidence', 0.5)),
+            edge_detected=bool(data.get('edge_detected', False)),
+            suggested_direction=data.get('direction', 'hold'),
+            fair_value_estimate=float(fair_value) if fair_value else None,
+            rationale=data.get('rationale', 'AI analysis'),
+            timestamp=datetime.now()
+        )
+    
+    def _parse_batch_response(self, markets: List[Dict], response: str,
+                              provider: AIProvider) -> Optional[List[Optional[AIAnalysis]]]:
         """
-        Analyze multiple markets, return top N with edge detected.
+        Parse a JSON array of analyses back onto their markets by market_index.
         
-        Filters to markets most likely to have value.
+        Returns None if the response is unusable; markets the model skipped
+        are left as None.
         """
-        # Pre-filter to interesting markets
-        interesting = []
-        for m in markets:
-            price = m.get('current_price', 0.5)
-            # Focus on markets with potential edge
-            if price >= 0.85 or price <= 0.18 or m.get('price_change'):
-                interesting.append(m)
+        try:
+            try:
+                data = _json_loads(response)
+            except ValueError:
+                data = None
+            
+            if isinstance(data, dict):
+                # Some models wrap the array in an object
+                data = next((v for v in data.values() if isinstance(v, list)), None)
+            
+            if not isinstance(data, list):
+                json_start = response.find('[')
+                json_end = response.rfind(']') + 1
+                if json_start < 0 or json_end <= json_start:
+                    return None
+                data = _json_loads(response[json_start:json_end])
+            
+            results: List[Optional[AIAnalysis]] = [None] * len(markets)
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                index = item.get('market_index')
+                if isinstance(index, int) and 0 <= index < len(markets) and results[index] is None:
+                    results[index] = self._analysis_from_data(markets[index], item, provider)
+            return results
+        except Exception as e:
+            print(f"⚠️ Failed to parse AI batch response: {e}")
+        
+        return None
+    
+    def _select_markets(self, markets: List[Dict], top_n: int) -> List[Dict]:
+        """Pre-filter to the markets most likely to have value."""
+        n = len(markets)
+        if n == 0:
+            return []
+        
+        prices = np.fromiter((m.get('current_price', 0.5) for m in markets), dtype=np.float64, count=n)
+        change = np.fromiter((m.get('price_change') or 0.0 for m in markets), dtype=np.float64, count=n)
+        
+        # Focus on markets with potential edge
+        mask = (prices >= 0.85) | (prices <= 0.18) | (change != 0.0)
         
         # Limit analysis to avoid rate limits
-        to_analyze = interesting[:min(len(interesting), top_n * 2)]
+        idxs = np.flatnonzero(mask)[:top_n * 2]
+        return [markets[i] for i in idxs.tolist()]
+    
+    def _analyze_batch_with_heuristics(self, markets: List[Dict]) -> List[AIAnalysis]:
+        """analyze_markets_batch over the markets without a fresh cached analysis."""
+        now = datetime.now()
+        analyses, pending = self._split_cached(markets, now)
+        for analysis in self.analyze_markets_batch(pending):
+            if analysis.market_id:
+                self._cache_put(analysis.market_id, analysis, now)
+            analyses.append(analysis)
+        return analyses
+    
+    def analyze_markets(self, markets: List[Dict], top_n: int = 10) -> List[AIAnalysis]:
+        """
+        Analyze multiple markets, return top N with edge detected.
         
-        analyses = []
-        for market in to_analyze:
-            analysis = self.analyze_market(market)
-            if analysis and analysis.edge_detected:
-                analyses.append(analysis)
+        Uses the pooled provider clients and the analysis cache; without an
+        LLM the heuristics score the whole batch in one vectorized pass, and
+        with Groq alone several markets go in each request. Otherwise up to
+        LLM_CONCURRENCY markets are analyzed at once, so a batch costs
+        about one LLM round trip per LLM_CONCURRENCY markets.
+        """
+        to_analyze = self._select_markets(markets, top_n)
+        
+        if not self.ollama_available and not self.groq_available:
+            analyses = self._analyze_batch_with_heuristics(to_analyze)
+        elif not self.ollama_available and len(to_analyze) > 1:
+            analyses = self._analyze_batch_with_groq(to_analyze)
+        else:
+            analyses = list(self._llm_pool.map(self.analyze_market, to_analyze))
+        analyses = [a for a in analyses if a and a.edge_detected]
         
         # Sort by confidence
         analyses.sort(key=lambda a: a.confidence, reverse=True)
@@ -9,18 +9,143 @@ Scans ALL markets for arbitrage opportunities:
 
 import sys
 import os
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Iterator
+from collections import OrderedDict
 from datetime import datetime
 
+import numpy as np
+
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import Config
 
+# Numba is optional: the scan kernel JIT-compiles when it is installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# ═══════════════════════════════════════════════════════════════════
+# YES/NO PRICE EXTRACTION
+# The market shape is detected once, then one extractor reads both sides.
+# Each mirrors ArbitrageDetector._get_price for YES and NO exactly.
+# ═══════════════════════════════════════════════════════════════════
+
+_YES_U, _YES_L = 'YES', 'yes'
+_NO_U, _NO_L = 'NO', 'no'
+_MISSING = object()  # Distinguishes an absent key from a stored None
+
+_SCHEMA_PRICE_DICT = 0  # current_price: {'yes': .., 'no': ..}
+_SCHEMA_TOKENS = 1      # tokens: [{'outcome': .., 'price': ..}, ...]
+_SCHEMA_OUTCOMES = 2    # outcomes: {'yes': .., 'no': ..}
+_SCHEMA_FLAT = 3        # yes_price / no_price / price keys
+_SCHEMA_PRICE = 4       # current_price: scalar used for both sides
+
+
+def _detect_schema(market: Dict) -> int:
+    """Classify which price layout a market uses."""
+    if 'current_price' in market:
+        return _SCHEMA_PRICE_DICT if isinstance(market['current_price'], dict) else _SCHEMA_PRICE
+    if 'tokens' in market:
+        return _SCHEMA_TOKENS
+    if isinstance(market.get('outcomes'), dict):
+        return _SCHEMA_OUTCOMES
+    return _SCHEMA_FLAT
+
+
+def _price_dict_prices(market: Dict) -> tuple:
+    price = market['current_price']
+    return price.get(_YES_L, price.get(_YES_U)), price.get(_NO_L, price.get(_NO_U))
+
+
+def _outcomes_prices(market: Dict) -> tuple:
+    outcomes = market['outcomes']
+    return outcomes.get(_YES_L, outcomes.get(_YES_U)), outcomes.get(_NO_L, outcomes.get(_NO_U))
+
+
+def _flat_prices(market: Dict) -> tuple:
+    yes_price = market.get('yes_price', market.get('price'))
+    try:
+        no_price = market.get('no_price', 1.0 - market.get('price', 0.5))
+    except Exception:
+        no_price = None
+    return yes_price, no_price
+
+
+def _scalar_prices(market: Dict) -> tuple:
+    price = market['current_price']
+    return price, price
+
+
+def _token_prices(market: Dict) -> tuple:
+    yes_price = no_price = None
+    found_yes = found_no = False
+    try:
+        tokens = iter(market['tokens'])
+    except Exception:
+        return None, None
+    
+    for token in tokens:
+        try:
+            outcome = token.get('outcome', '').upper()
+        except Exception:
+            # A malformed token ends the search for any side still missing
+            return yes_price, no_price
+        
+        if outcome == _YES_U and not found_yes:
+            found_yes = True
+            try:
+                yes_price = float(token.get('price', 0))
+            except Exception:
+                yes_price = None
+        elif outcome == _NO_U and not found_no:
+            found_no = True
+            try:
+                no_price = float(token.get('price', 0))
+            except Exception:
+                no_price = None
+        
+        if found_yes and found_no:
+            return yes_price, no_price
+    
+    # Sides missing from the token list fall through to the other layouts
+    if isinstance(market.get('outcomes'), dict):
+        rest = _outcomes_prices(market)
+    else:
+        rest = _flat_prices(market)
+    return (yes_price if found_yes else rest[0]), (no_price if found_no else rest[1])
+
+
+_PRICE_EXTRACTORS = (_price_dict_prices, _token_prices, _outcomes_prices, _flat_prices, _scalar_prices)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# YES + NO SCAN KERNEL
+# Pure array arithmetic so Numba can compile it; plain NumPy otherwise.
+# No fastmath: NaN marks an unpriced market and must never pass the edge test.
+# ═══════════════════════════════════════════════════════════════════
+
+def _scan_kernel(yes_prices: np.ndarray, no_prices: np.ndarray, min_edge_cents: float) -> tuple:
+    """Return (edge_cents, hits) for every market in the SoA price arrays."""
+    edge_cents = (1.0 - (yes_prices + no_prices)) * 100.0
+    hits = edge_cents >= min_edge_cents
+    return edge_cents, hits
+
+
+if NUMBA_AVAILABLE:
+    _scan_kernel = njit(cache=True)(_scan_kernel)
+
 
 class ArbitrageOpportunity:
     """Represents an arbitrage opportunity."""
     
+    __slots__ = ('market_id', 'market_question', 'opportunity_type', 'yes_price',
+                 'no_price', 'edge_cents', 'optimal_size_usd', 'rationale', 'timestamp')
+    
     def __init__(self, market_id: str, market_question: str, opportunity_type: str,
                  yes_price: float, no_price: float, edge_cents: float, 
                  optimal_size_usd: float, rationale: str):
@@ -32,7 +157,7 @@ class ArbitrageOpportunity:
         self.edge_cents = edge_cents
         self.optimal_size_usd = optimal_size_usd
         self.rationale = rationale
-        self.timestamp = datetime.now()
+        self.timestamp = time.time()  # Epoch seconds; formatted in to_dict
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging/storage."""
@@ -45,7 +170,7 @@ class ArbitrageOpportunity:
             'edge_cents': self.edge_cents,
             'optimal_size_usd': self.optimal_size_usd,
             'rationale': self.rationale,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': datetime.fromtimestamp(self.timestamp).isoformat()
         }
 
 
@@ -63,10 +188,22 @@ class ArbitrageDetector:
     def __init__(self):
         self.min_edge_cents = Config.ARB_MIN_EDGE_CENTS
         self.scan_resolved = Config.ARB_SCAN_RESOLVED
+        self.verbose = Config.DEBUG_MODE  # Per-opportunity prints; scan summaries always print
+        
+        # Cost ceiling matching min_edge_cents, for rejecting most markets
+        # before computing an edge (the slack keeps the cents check exact)
+        self._max_cost = 1.0 - self.min_edge_cents / 100.0 + 1e-9
         self.opportunities_found_today = 0
         self.last_scan_time = None
+        
+        # Resolved markets never change outcome: remember which were already
+        # reported, and the last winning price of those without an edge
+        # (both LRU-bounded)
+        self._resolved_reported: OrderedDict = OrderedDict()
+        self._resolved_price_cache: OrderedDict = OrderedDict()
+        self._resolved_cache_max = 10_000
     
-    def scan_markets(self, markets: List[Dict], available_balance: float = None) -> List[ArbitrageOpportunity]:
+    def scan_markets(self, markets: List[Dict], available_balance: float = None) -> Iterator[ArbitrageOpportunity]:
         """
         Scan all markets for arbitrage opportunities.
         
@@ -74,30 +211,80 @@ class ArbitrageDetector:
             markets: List of market data from Polymarket
             available_balance: Optional balance for position sizing
         
-        Returns:
-            List of arbitrage opportunities
+        Yields:
+            Arbitrage opportunities as they are found; wrap in list() to
+            collect them all, or stop early to act on the first one
         """
-        opportunities = []
+        found = 0
         
-        for market in markets:
+        yes_prices, no_prices, resolved = self._markets_to_soa(markets)
+        
+        # YES + NO edge for every market in one kernel pass (NaN never passes)
+        edge_cents, yes_no_hits = _scan_kernel(yes_prices, no_prices, float(self.min_edge_cents))
+        
+        candidates = yes_no_hits | resolved
+        
+        # Size every YES + NO hit at once
+        sizes = np.full(len(markets), np.nan)
+        hit_idx = np.flatnonzero(yes_no_hits)
+        sizes[hit_idx] = self._calculate_optimal_sizes(edge_cents[hit_idx], available_balance)
+        
+        # Only markets that can produce an opportunity reach Python object code;
+        # merged feeds can repeat a market, so each id is checked once per scan
+        seen = set()
+        for i in np.flatnonzero(candidates).tolist():
+            market = markets[i]
+            market_id = market.get('id') or market.get('condition_id')
+            if market_id:
+                if market_id in seen:
+                    continue
+                seen.add(market_id)
+            
             # Check YES + NO arbitrage
-            yes_no_opp = self._check_yes_no_arbitrage(market, available_balance)
-            if yes_no_opp:
-                opportunities.append(yes_no_opp)
+            if yes_no_hits[i]:
+                found += 1
+                self.opportunities_found_today += 1
+                yield self._build_yes_no_opportunity(
+                    market, float(yes_prices[i]), float(no_prices[i]), available_balance,
+                    optimal_size=float(sizes[i])
+                )
             
-            # Check resolved market arbitrage
-            if self.scan_resolved:
-                resolved_opp = self._check_resolved_arbitrage(market, available_balance)
+            # Check resolved market arbitrage (flag already tested in the SoA pass)
+            if resolved[i]:
+                resolved_opp = self._check_resolved_arbitrage(market, available_balance,
+                                                              resolved_checked=True)
                 if resolved_opp:
-                    opportunities.append(resolved_opp)
+                    found += 1
+                    self.opportunities_found_today += 1
+                    yield resolved_opp
         
-        self.opportunities_found_today += len(opportunities)
         self.last_scan_time = datetime.now()
         
-        if opportunities:
-            print(f"🎯 Arbitrage: Found {len(opportunities)} opportunities (Total today: {self.opportunities_found_today})")
+        if found:
+            print(f"🎯 Arbitrage: Found {found} opportunities (Total today: {self.opportunities_found_today})")
+    
+    def _markets_to_soa(self, markets: List[Dict]):
+        """
+        Walk the market list once into contiguous arrays.
+        
+        Returns (yes_prices, no_prices, resolved); prices that are missing or
+        not numeric are NaN so they never produce an edge. Resolved flags are
+        all False unless resolved scanning is enabled.
+        """
+        n = len(markets)
+        yes_prices = np.empty(n, dtype=np.float64)
+        no_prices = np.empty(n, dtype=np.float64)
+        resolved = np.zeros(n, dtype=np.bool_)
+        scan_resolved = self.scan_resolved  # Flags are only read when they are used
         
-        return opportunities
+        for i, market in enumerate(markets):
+            yes_price, no_price = self._get_yes_no_prices(market)
+            yes_prices[i] = yes_price if isinstance(yes_price, (int, float)) else np.nan
+            no_prices[i] = no_price if isinstance(no_price, (int, float)) else np.nan
+            if scan_resolved:
+                resolved[i] = bool(market.get('resolved', False) or market.get('closed', False))
+        
+        return yes_prices, no_prices, resolved
     
     def _check_yes_no_arbitrage(self, market: Dict, available_balance: Optional[float]) -> Optional[ArbitrageOpportunity]:
         """
@@ -106,57 +293,71 @@ class ArbitrageDetector:
         """
         try:
             # Get YES and NO prices
-            yes_price = self._get_price(market, 'YES')
-            no_price = self._get_price(market, 'NO')
+            yes_price, no_price = self._get_yes_no_prices(market)
             
             if yes_price is None or no_price is None:
                 return None
             
-            # Calculate edge
+            # Calculate edge (only for markets under the cost ceiling)
             total_cost = yes_price + no_price
+            if total_cost > self._max_cost:
+                return None
             edge_cents = (1.0 - total_cost) * 100
             
             # Check if edge exceeds minimum
             if edge_cents < self.min_edge_cents:
                 return None
             
-            # Calculate optimal position size
-            optimal_size = self._calculate_optimal_size(edge_cents, available_balance)
-            
-            market_id = market.get('id', market.get('condition_id', ''))
-            market_question = market.get('question', market.get('title', 'Unknown'))
-            
-            rationale = (
-                f"YES+NO=${total_cost:.3f} < $1.00. "
-                f"Buy both sides for ${total_cost:.3f}, redeem for $1.00. "
-                f"Guaranteed profit: {edge_cents:.1f}¢ per dollar invested."
-            )
-            
-            print(f"🎯 Arbitrage: Found YES+NO=${total_cost:.3f} opportunity ({edge_cents:.1f}¢ edge)")
-            
-            return ArbitrageOpportunity(
-                market_id=market_id,
-                market_question=market_question,
-                opportunity_type='yes_no_arb',
-                yes_price=yes_price,
-                no_price=no_price,
-                edge_cents=edge_cents,
-                optimal_size_usd=optimal_size,
-                rationale=rationale
-            )
+            return self._build_yes_no_opportunity(market, yes_price, no_price, available_balance)
             
         except Exception as e:
             # Silently skip on error - don't crash scanner
             return None
     
-    def _check_resolved_arbitrage(self, market: Dict, available_balance: Optional[float]) -> Optional[ArbitrageOpportunity]:
+    def _build_yes_no_opportunity(self, market: Dict, yes_price: float, no_price: float,
+                                  available_balance: Optional[float],
+                                  optimal_size: Optional[float] = None) -> ArbitrageOpportunity:
+        """Build a YES + NO opportunity for prices already known to clear the edge."""
+        total_cost = yes_price + no_price
+        edge_cents = (1.0 - total_cost) * 100
+        
+        # Calculate optimal position size (batch scans pass it in precomputed)
+        if optimal_size is None:
+            optimal_size = self._calculate_optimal_size(edge_cents, available_balance)
+        
+        market_id = market.get('id', market.get('condition_id', ''))
+        market_question = market.get('question', market.get('title', 'Unknown'))
+        
+        rationale = (
+            f"YES+NO=${total_cost:.3f} < $1.00. "
+            f"Buy both sides for ${total_cost:.3f}, redeem for $1.00. "
+            f"Guaranteed profit: {edge_cents:.1f}¢ per dollar invested."
+        )
+        
+        if self.verbose:
+            print(f"🎯 Arbitrage: Found YES+NO=${total_cost:.3f} opportunity ({edge_cents:.1f}¢ edge)")
+        
+        return ArbitrageOpportunity(
+            market_id=market_id,
+            market_question=market_question,
+            opportunity_type='yes_no_arb',
+            yes_price=yes_price,
+            no_price=no_price,
+            edge_cents=edge_cents,
+            optimal_size_usd=optimal_size,
+            rationale=rationale
+        )
+    
+    def _check_resolved_arbitrage(self, market: Dict, available_balance: Optional[float],
+                                  resolved_checked: bool = False) -> Optional[ArbitrageOpportunity]:
         """
         Check if market is resolved with winning shares trading < $1.00.
+        
+        Pass resolved_checked=True when the caller already tested the flags.
         """
         try:
             # Check if market is resolved
-            is_resolved = market.get('resolved', False) or market.get('closed', False)
-            if not is_resolved:
+            if not resolved_checked and not (market.get('resolved', False) or market.get('closed', False)):
                 return None
             
             # Get winning outcome
@@ -164,21 +365,33 @@ class ArbitrageDetector:
             if not winning_outcome:
                 return None
             
+            # Already reported this resolved market
+            market_id = market.get('id', market.get('condition_id', ''))
+            if market_id in self._resolved_reported:
+                return None
+            
             # Get current price of winning outcome
             winning_price = self._get_price(market, winning_outcome)
-            if winning_price is None or winning_price >= 0.99:
+            if winning_price is None:
                 return None
             
-            # Calculate edge
-            edge_cents = (1.0 - winning_price) * 100
+            # Unchanged since it last showed no edge
+            cached_price = self._resolved_price_cache.get(market_id)
+            if cached_price is not None and abs(cached_price - winning_price) < 0.001:
+                return None
             
-            if edge_cents < self.min_edge_cents:
+            # Calculate edge (only for prices under the cost ceiling)
+            if (winning_price >= 0.99 or winning_price > self._max_cost or
+                    (1.0 - winning_price) * 100 < self.min_edge_cents):
+                self._remember_resolved(self._resolved_price_cache, market_id, winning_price)
                 return None
             
+            self._remember_resolved(self._resolved_reported, market_id, True)
+            edge_cents = (1.0 - winning_price) * 100
+            
             # Calculate optimal position size
             optimal_size = self._calculate_optimal_size(edge_cents, available_balance)
             
-            market_id = market.get('id', market.get('condition_id', ''))
             market_question = market.get('question', market.get('title', 'Unknown'))
             
             rationale = (
@@ -188,7 +401,8 @@ class ArbitrageDetector:
                 f"Guaranteed profit: {edge_cents:.1f}¢ per share."
             )
             
-            print(f"🎯 Arbitrage: Found resolved market with {winning_outcome}=${winning_price:.3f} ({edge_cents:.1f}¢ edge)")
+            if self.verbose:
+                print(f"🎯 Arbitrage: Found resolved market with {winning_outcome}=${winning_price:.3f} ({edge_cents:.1f}¢ edge)")
             
             return ArbitrageOpportunity(
                 market_id=market_id,
@@ -205,30 +419,50 @@ class ArbitrageDetector:
             # Silently skip on error
             return None
     
+    def _remember_resolved(self, cache: OrderedDict, market_id: str, value) -> None:
+        """Insert into a resolved-market cache, evicting the oldest entry when full."""
+        if not market_id:
+            return  # Can't tell id-less markets apart
+        cache[market_id] = value
+        cache.move_to_end(market_id)
+        if len(cache) > self._resolved_cache_max:
+            cache.popitem(last=False)
+    
+    def _get_yes_no_prices(self, market: Dict) -> tuple:
+        """Extract (yes_price, no_price) with a single schema dispatch."""
+        try:
+            return _PRICE_EXTRACTORS[_detect_schema(market)](market)
+        except Exception:
+            return None, None
+    
     def _get_price(self, market: Dict, outcome: str) -> Optional[float]:
         """Extract price for given outcome from market data."""
         try:
+            # Fold the outcome's case once instead of per key and per token
+            outcome_u = outcome.upper()
+            outcome_l = outcome.lower()
+            
             # Try multiple possible data structures
-            if 'current_price' in market:
-                price = market['current_price']
+            price = market.get('current_price', _MISSING)
+            if price is not _MISSING:
                 if isinstance(price, dict):
-                    return price.get(outcome.lower(), price.get(outcome.upper()))
+                    return price.get(outcome_l, price.get(outcome_u))
                 return price
             
-            if 'tokens' in market:
-                for token in market['tokens']:
-                    if token.get('outcome', '').upper() == outcome.upper():
+            tokens = market.get('tokens', _MISSING)
+            if tokens is not _MISSING:
+                for token in tokens:
+                    if token.get('outcome', '').upper() == outcome_u:
                         return float(token.get('price', 0))
             
-            if 'outcomes' in market:
-                outcomes = market['outcomes']
-                if isinstance(outcomes, dict):
-                    return outcomes.get(outcome.lower(), outcomes.get(outcome.upper()))
+            outcomes = market.get('outcomes')
+            if isinstance(outcomes, dict):
+                return outcomes.get(outcome_l, outcomes.get(outcome_u))
             
             # Direct price keys
-            if outcome.upper() == 'YES':
+            if outcome_u == _YES_U:
                 return market.get('yes_price', market.get('price'))
-            elif outcome.upper() == 'NO':
+            elif outcome_u == _NO_U:
                 return market.get('no_price', 1.0 - market.get('price', 0.5))
             
             return None
@@ -236,22 +470,26 @@ class ArbitrageDetector:
         except Exception:
             return None
     
-    def _calculate_optimal_size(self, edge_cents: float, available_balance: Optional[float]) -> float:
+    def _calculate_optimal_sizes(self, edge_cents: np.ndarray,
+                                 available_balance: Optional[float]) -> np.ndarray:
         """
-        Calculate optimal position size based on edge and available balance.
+        Calculate optimal position sizes for a batch of edges.
         Uses Kelly Criterion with conservative scaling.
         """
+        edge_cents = np.asarray(edge_cents, dtype=np.float64)
         if available_balance is None or available_balance <= 0:
             # Default to max position size from config
-            return Config.MAX_POSITION_USD
+            return np.full(edge_cents.shape, float(Config.MAX_POSITION_USD))
         
         # For arbitrage, we can be aggressive since it's risk-free
         # Use 25% of available balance or max position, whichever is smaller
         kelly_fraction = 0.25
-        optimal_size = available_balance * kelly_fraction
-        
-        # Cap at max position size
-        return min(optimal_size, Config.MAX_POSITION_USD)
+        optimal_size = np.clip(available_balance * kelly_fraction, 0, Config.MAX_POSITION_USD)
+        return np.full(edge_cents.shape, optimal_size)
+    
+    def _calculate_optimal_size(self, edge_cents: float, available_balance: Optional[float]) -> float:
+        """Scalar wrapper around _calculate_optimal_sizes."""
+        return float(self._calculate_optimal_sizes(np.array([edge_cents]), available_balance)[0])
     
     def get_stats(self) -> Dict[str, Any]:
         """Get arbitrage detector statistics."""
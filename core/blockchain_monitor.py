@@ -13,10 +13,16 @@ Uses:
 import sys
 import os
 import time
+import asyncio
+import functools
 import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Callable
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -24,7 +30,7 @@ from config import Config
 from config_aggressive import AggressiveConfig
 
 try:
-    from web3 import Web3
+    from web3 import Web3, AsyncWeb3, WebSocketProvider
     # web3.py v7+ uses ExtraDataToPOAMiddleware for PoA chains
     from web3.middleware import ExtraDataToPOAMiddleware
     WEB3_AVAILABLE = True
@@ -33,6 +39,47 @@ except ImportError:
     print("⚠️ web3 not installed. Blockchain monitoring disabled.")
 
 
+# Polymarket CTF Exchange fill event. Asset id 0 is the USDC collateral side;
+# any other id is an outcome token. Both use 6 decimals.
+ORDER_FILLED_SIGNATURE = "OrderFilled(bytes32,address,address,uint256,uint256,uint256,uint256,uint256)"
+ORDER_FILLED_ABI = {
+    'anonymous': False,
+    'name': 'OrderFilled',
+    'type': 'event',
+    'inputs': [
+        {'indexed': True, 'name': 'orderHash', 'type': 'bytes32'},
+        {'indexed': True, 'name': 'maker', 'type': 'address'},
+        {'indexed': True, 'name': 'taker', 'type': 'address'},
+        {'indexed': False, 'name': 'makerAssetId', 'type': 'uint256'},
+        {'indexed': False, 'name': 'takerAssetId', 'type': 'uint256'},
+        {'indexed': False, 'name': 'makerAmountFilled', 'type': 'uint256'},
+        {'indexed': False, 'name': 'takerAmountFilled', 'type': 'uint256'},
+        {'indexed': False, 'name': 'fee', 'type': 'uint256'},
+    ],
+}
+TOKEN_UNIT = 10 ** 6
+
+# Chainlink MATIC(POL)/USD aggregator on Polygon; the chain's native token
+# is what tx.value carries
+MATIC_USD_FEED = '0xAB594600376Ec9fD91F8e885dADF0CE036862dE0'
+AGGREGATOR_ABI = [{
+    'name': 'latestRoundData',
+    'type': 'function',
+    'stateMutability': 'view',
+    'inputs': [],
+    'outputs': [
+        {'name': 'roundId', 'type': 'uint80'},
+        {'name': 'answer', 'type': 'int256'},
+        {'name': 'startedAt', 'type': 'uint256'},
+        {'name': 'updatedAt', 'type': 'uint256'},
+        {'name': 'answeredInRound', 'type': 'uint80'},
+    ],
+}]
+FEED_DECIMALS = 8
+FALLBACK_MATIC_USD = 0.5  # Only used until the oracle has answered once
+MAX_LOG_BLOCK_RANGE = 500  # Catch-up window for a single eth_getLogs call
+
+
 class BlockchainWhaleMonitor:
     """
     Monitors Polygon blockchain for whale trades on Polymarket.
@@ -50,9 +97,16 @@ class BlockchainWhaleMonitor:
         
         self.min_trade_usd = min_trade_usd or Config.WHALE_MIN_TRADE_USD
         self.poll_seconds = AggressiveConfig.BLOCKCHAIN_POLL_SECONDS
+        self.verbose = Config.DEBUG_MODE  # Wallet/block detail for each whale trade
+        self.wss_url = Config.POLYGON_WSS_URL  # Subscribe instead of polling when set
         
-        # Connect to Polygon
-        self.w3 = Web3(Web3.HTTPProvider(Config.POLYGON_RPC_URL))
+        # Connect to Polygon over one keep-alive session; the pool is sized so
+        # every block-fetch worker keeps a warm socket to the RPC node
+        self._rpc_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=3)
+        self._rpc_session.mount('https://', adapter)
+        self._rpc_session.mount('http://', adapter)
+        self.w3 = Web3(Web3.HTTPProvider(Config.POLYGON_RPC_URL, session=self._rpc_session))
         
         # CRITICAL: Add POA middleware for Polygon chain
         # Polygon uses PoA/PoS with 586-byte extraData field (vs standard 32 bytes)
@@ -60,16 +114,42 @@ class BlockchainWhaleMonitor:
         
         # CLOB contract address
         self.clob_contract_address = AggressiveConfig.POLYMARKET_CLOB_CONTRACT
+        # web3 returns tx.to checksummed, so one canonical form compares directly
+        self._clob_checksum = Web3.to_checksum_address(self.clob_contract_address)
+        
+        # Trade events are filtered server-side with eth_getLogs
+        self.trade_topic = Web3.to_hex(Web3.keccak(text=ORDER_FILLED_SIGNATURE))
+        self._order_filled = self.w3.eth.contract(
+            address=self._clob_checksum,
+            abi=[ORDER_FILLED_ABI]
+        ).events.OrderFilled()
+        
+        # Native token price, refreshed from the oracle at most once a minute
+        self._matic_feed = self.w3.eth.contract(address=MATIC_USD_FEED, abi=AGGREGATOR_ABI)
+        self._last_matic_usd = FALLBACK_MATIC_USD
+        self._matic_usd_at = functools.lru_cache(maxsize=1)(self._fetch_matic_usd)
         
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = AggressiveConfig.BLOCKCHAIN_RATE_LIMIT_SECONDS
+        self.rpc_batch_size = max(1, AggressiveConfig.RPC_BATCH_SIZE)
+        
+        # Overlaps single get_block calls when the RPC rejects batches
+        self._block_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='block-fetch')
+        
+        # Observed block cadence (EMA of seconds per block) drives the poll delay
+        self._block_time_ema = 2.0  # Polygon's nominal block time
+        self._last_poll_block = None
+        self._last_poll_time = None
         
         # State
         self.last_block_checked = None
         self.running = False
         self.monitor_thread = None
+        self._ws_loop = None
+        self._ws_task = None
         self.callbacks = []  # List of callback functions to call on whale trade
+        self.recent_trades = deque(maxlen=10_000)  # Latest whale trades, oldest evicted
         
         # Stats
         self.trades_detected = 0
@@ -79,7 +159,10 @@ class BlockchainWhaleMonitor:
         print(f"⛓️ Blockchain Whale Monitor initialized")
         print(f"   RPC: {Config.POLYGON_RPC_URL}")
         print(f"   Min trade size: ${self.min_trade_usd}")
-        print(f"   Poll interval: {self.poll_seconds}s")
+        if self.wss_url:
+            print(f"   Mode: WebSocket log subscription")
+        else:
+            print(f"   Poll interval: adaptive (~0.8x block time, max {self.poll_seconds}s)")
         
         # Test connection
         try:
@@ -116,13 +199,20 @@ class BlockchainWhaleMonitor:
             return
         
         self.running = True
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        target = self._run_ws_loop if self.wss_url else self._monitor_loop
+        self.monitor_thread = threading.Thread(target=target, daemon=True)
         self.monitor_thread.start()
         print("✅ Blockchain monitor started")
     
     def stop_monitoring(self):
         """Stop background monitoring thread."""
         self.running = False
+        if self._ws_loop and self._ws_task:
+            # Wake the subscription loop, which is blocked waiting for logs
+            try:
+                self._ws_loop.call_soon_threadsafe(self._ws_task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
         print("✅ Blockchain monitor stopped")
@@ -143,11 +233,42 @@ class BlockchainWhaleMonitor:
         while self.running:
             try:
                 self._scan_recent_blocks()
-                time.sleep(self.poll_seconds)
+                time.sleep(self._next_poll_delay())
             except Exception as e:
                 print(f"⚠️ Blockchain monitor error: {e}")
                 time.sleep(self.poll_seconds * 2)  # Back off on error
     
+    def _run_ws_loop(self):
+        """WebSocket monitoring loop (runs in background thread), reconnecting on error."""
+        print("🔍 Monitoring blockchain for whale trades (WebSocket)...")
+        
+        while self.running:
+            try:
+                asyncio.run(self._monitor_loop_ws())
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"⚠️ WebSocket monitor error: {e}")
+                time.sleep(self.poll_seconds * 2)  # Back off before reconnecting
+    
+    async def _monitor_loop_ws(self):
+        """Subscribe to CLOB OrderFilled logs and handle them as the node pushes them."""
+        self._ws_loop = asyncio.get_running_loop()
+        self._ws_task = asyncio.current_task()
+        
+        async with AsyncWeb3(WebSocketProvider(self.wss_url)) as w3:
+            await w3.eth.subscribe('logs', {
+                'address': self._clob_checksum,
+                'topics': [self.trade_topic],
+            })
+            
+            async for payload in w3.socket.process_subscriptions():
+                if not self.running:
+                    break
+                log = payload.get('result', payload) if isinstance(payload, dict) else payload
+                self._handle_log(log)
+                self.last_block_checked = log.get('blockNumber', self.last_block_checked)
+    
     def _scan_recent_blocks(self):
         """Scan recent blocks for whale trades."""
         # Wait for rate limit before making API call
@@ -156,45 +277,212 @@ class BlockchainWhaleMonitor:
         try:
             current_block = self.w3.eth.block_number
             
-            # Scan blocks since last check (max 10 blocks to avoid overload)
-            start_block = max(self.last_block_checked + 1, current_block - 10)
+            # Logs are cheap, so catch up over a wider window than block scans
+            start_block = max(self.last_block_checked + 1, current_block - MAX_LOG_BLOCK_RANGE)
             
             if start_block > current_block:
                 return  # No new blocks
             
-            # Scan blocks
-            for block_num in range(start_block, current_block + 1):
-                self._scan_block(block_num)
-                self.blocks_scanned += 1
+            try:
+                self._scan_trade_logs(start_block, current_block)
+            except Exception as e:
+                # Some RPCs refuse eth_getLogs - fall back to full block scans
+                # (max 10 blocks to avoid overload)
+                print(f"⚠️ Log query failed, scanning blocks instead: {e}")
+                self._scan_blocks(max(start_block, current_block - 10), current_block)
             
             self.last_block_checked = current_block
+            self._update_block_time(current_block)
             
         except Exception as e:
             print(f"⚠️ Error scanning blocks: {e}")
     
+    def _update_block_time(self, current_block: int):
+        """Fold the blocks seen since the last advancing poll into the block-time EMA."""
+        now = time.monotonic()
+        if self._last_poll_block is not None:
+            dt = (now - self._last_poll_time) / (current_block - self._last_poll_block)
+            self._block_time_ema = 0.9 * self._block_time_ema + 0.1 * dt
+        self._last_poll_block = current_block
+        self._last_poll_time = now
+    
+    def _next_poll_delay(self) -> float:
+        """
+        Sleep a bit less than one block time, capped at BLOCKCHAIN_POLL_SECONDS,
+        but never past the RPC rate limit.
+        """
+        delay = min(self.poll_seconds, max(0.5, self._block_time_ema * 0.8))
+        rate_limit_wait = self.min_request_interval - (time.time() - self.last_request_time)
+        return max(delay, rate_limit_wait)
+    
+    def _scan_trade_logs(self, from_block: int, to_block: int):
+        """Fetch CLOB OrderFilled events for a block range in one call."""
+        logs = self.w3.eth.get_logs({
+            'address': self._clob_checksum,
+            'topics': [self.trade_topic],
+            'fromBlock': from_block,
+            'toBlock': to_block,
+        })
+        self.blocks_scanned += to_block - from_block + 1
+        
+        for log in logs:
+            self._handle_log(log)
+    
+    def _handle_log(self, log):
+        """Decode one OrderFilled log and emit it if it is a whale trade."""
+        try:
+            event = self._order_filled.process_log(log)
+        except Exception:
+            return  # Not a decodable OrderFilled log
+        
+        whale_trade = self._parse_order_filled(event, log.get('blockTimestamp'))
+        if whale_trade:
+            self._emit_whale_trade(whale_trade)
+    
+    def _emit_whale_trade(self, whale_trade: Dict):
+        """Count a whale trade and pass it to every registered callback."""
+        self.whale_trades_detected += 1
+        self.recent_trades.append(whale_trade)
+        
+        # Call all registered callbacks
+        for callback in self.callbacks:
+            try:
+                callback(whale_trade)
+            except Exception as e:
+                print(f"⚠️ Callback error: {e}")
+    
+    def _scan_blocks(self, start_block: int, end_block: int):
+        """
+        Scan a block range, fetching up to rpc_batch_size blocks per
+        JSON-RPC batch request.
+        """
+        for chunk_start in range(start_block, end_block + 1, self.rpc_batch_size):
+            block_nums = range(chunk_start, min(chunk_start + self.rpc_batch_size, end_block + 1))
+            
+            try:
+                with self.w3.batch_requests() as batch:
+                    for block_num in block_nums:
+                        batch.add(self.w3.eth.get_block(block_num, full_transactions=True))
+                    blocks = batch.execute()
+            except Exception as e:
+                # Provider without batch support - fetch blocks concurrently
+                print(f"⚠️ Batch block fetch failed, fetching singly: {e}")
+                self._scan_blocks_concurrently(block_nums)
+                continue
+            
+            for block_num, block in zip(block_nums, blocks):
+                try:
+                    self._scan_block_transactions(block)
+                except Exception as e:
+                    print(f"⚠️ Error scanning block {block_num}: {e}")
+                self.blocks_scanned += 1
+    
+    def _scan_blocks_concurrently(self, block_nums: range):
+        """
+        Fetch blocks on the worker pool so their RPC round trips overlap.
+        Results are processed in block order on the calling thread.
+        """
+        futures = [
+            self._block_pool.submit(self.w3.eth.get_block, block_num, True)
+            for block_num in block_nums
+        ]
+        for block_num, future in zip(block_nums, futures):
+            try:
+                self._scan_block_transactions(future.result())
+            except Exception as e:
+                print(f"⚠️ Error scanning block {block_num}: {e}")
+            self.blocks_scanned += 1
+    
     def _scan_block(self, block_number: int):
         """Scan a single block for whale trades."""
         try:
             block = self.w3.eth.get_block(block_number, full_transactions=True)
-            
-            for tx in block.transactions:
-                # Check if transaction is to CLOB contract
-                if tx.to and tx.to.lower() == self.clob_contract_address.lower():
-                    whale_trade = self._parse_transaction(tx, block.timestamp)
-                    
-                    if whale_trade:
-                        self.whale_trades_detected += 1
-                        
-                        # Call all registered callbacks
-                        for callback in self.callbacks:
-                            try:
-                                callback(whale_trade)
-                            except Exception as e:
-                                print(f"⚠️ Callback error: {e}")
+            self._scan_block_transactions(block)
         
         except Exception as e:
             print(f"⚠️ Error scanning block {block_number}: {e}")
     
+    def _scan_block_transactions(self, block):
+        """Check a fetched block's transactions for CLOB whale trades."""
+        clob = self._clob_checksum
+        for tx in block.transactions:
+            # Check if transaction is to CLOB contract
+            if tx.to == clob:
+                whale_trade = self._parse_transaction(tx, block.timestamp)
+                
+                if whale_trade:
+                    self._emit_whale_trade(whale_trade)
+    
+    def _parse_order_filled(self, event, timestamp: Optional[int]) -> Optional[Dict]:
+        """
+        Turn a decoded OrderFilled event into a whale trade record.
+        
+        The maker paying USDC (asset id 0) is buying outcome tokens; the maker
+        giving outcome tokens is selling. Size and price come from the fill.
+        """
+        self.trades_detected += 1
+        
+        args = event['args']
+        maker_asset = args['makerAssetId']
+        maker_amount = args['makerAmountFilled']
+        taker_amount = args['takerAmountFilled']
+        
+        if maker_asset == 0:
+            side = 'BUY'
+            token_id = args['takerAssetId']
+            usdc_amount, token_amount = maker_amount, taker_amount
+        else:
+            side = 'SELL'
+            token_id = maker_asset
+            usdc_amount, token_amount = taker_amount, maker_amount
+        
+        if not token_amount:
+            return None
+        
+        size_usd = usdc_amount / TOKEN_UNIT
+        if size_usd < self.min_trade_usd:
+            return None
+        
+        # blockTimestamp is only present on some RPCs
+        if timestamp is not None:
+            trade_time = datetime.fromtimestamp(int(timestamp, 16) if isinstance(timestamp, str) else timestamp)
+        else:
+            trade_time = datetime.now()
+        
+        wallet_address = args['maker']
+        
+        whale_trade = {
+            'wallet_address': wallet_address,
+            'market_id': str(token_id),  # Outcome token id
+            'side': side,
+            'size_usd': size_usd,
+            'price': usdc_amount / token_amount,
+            'timestamp': trade_time,
+            'tx_hash': Web3.to_hex(event['transactionHash']),
+            'block_number': event['blockNumber']
+        }
+        
+        print(f"🐋 Whale trade detected: ${size_usd:.0f} {side} @ {whale_trade['price']:.3f}")
+        if self.verbose:
+            print(f"   Wallet: {wallet_address[:10]}...")
+            print(f"   Block: {event['blockNumber']}")
+        
+        return whale_trade
+    
+    def _fetch_matic_usd(self, bucket: int) -> float:
+        """Read MATIC/USD from Chainlink; `bucket` only keys the one-minute cache."""
+        try:
+            answer = self._matic_feed.functions.latestRoundData().call()[1]
+            if answer > 0:
+                self._last_matic_usd = answer / 10 ** FEED_DECIMALS
+        except Exception as e:
+            print(f"⚠️ MATIC/USD oracle failed, using ${self._last_matic_usd:.4f}: {e}")
+        return self._last_matic_usd
+    
+    def _matic_usd(self) -> float:
+        """Current MATIC/USD price, cached per wall-clock minute."""
+        return self._matic_usd_at(int(time.time() // 60))
+    
     def _parse_transaction(self, tx, timestamp: int) -> Optional[Dict]:
         """
         Parse a transaction to extract whale trade info.
@@ -219,9 +507,8 @@ class BlockchainWhaleMonitor:
         if value_eth < 0.001:
             return None
         
-        # Estimate USD value (simplified - would need price oracle in production)
-        # Assume 1 ETH = $2000 for estimation
-        estimated_usd = float(value_eth) * 2000
+        # Estimate USD value from the native token price
+        estimated_usd = float(value_eth) * self._matic_usd()
         
         if estimated_usd < self.min_trade_usd:
             return None
@@ -241,18 +528,24 @@ class BlockchainWhaleMonitor:
             'block_number': tx.blockNumber
         }
         
-        print(f"🐋 Whale trade detected!")
-        print(f"   Wallet: {wallet_address[:10]}...")
-        print(f"   Size: ~${estimated_usd:.0f}")
-        print(f"   Block: {tx.blockNumber}")
+        print(f"🐋 Whale trade detected: ~${estimated_usd:.0f}")
+        if self.verbose:
+            print(f"   Wallet: {wallet_address[:10]}...")
+            print(f"   Block: {tx.blockNumber}")
         
         return whale_trade
     
+    def get_recent_trades(self, limit: int = None) -> List[Dict]:
+        """Snapshot of the most recent whale trades, oldest first."""
+        trades = list(self.recent_trades)
+        return trades[-limit:] if limit else trades
+    
     def get_stats(self) -> Dict:
         """Get monitoring statistics."""
         return {
             'running': self.running,
             'last_block': self.last_block_checked,
+            'block_time_ema': self._block_time_ema,
             'blocks_scanned': self.blocks_scanned,
             'trades_detected': self.trades_detected,
             'whale_trades_detected': self.whale_trades_detected,
@@ -288,6 +581,10 @@ class MockBlockchainMonitor:
         self.running = False
         print("✅ Mock blockchain monitor stopped")
     
+    def get_recent_trades(self, limit: int = None) -> List[Dict]:
+        """Mock monitor never sees trades."""
+        return []
+    
     def get_stats(self) -> Dict:
         """Get stats."""
         return {
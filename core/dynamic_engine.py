@@ -8,14 +8,19 @@ Cascade Logic:
 2. Try HIGH priority (overreaction, lag arb)
 3. Try MEDIUM priority (market only, draw decay)
 4. Try LOW priority (volatility scalp, favorite trap)
+   (3 and 4 are skipped once 1 and 2 find CASCADE_MIN_SIGNALS signals)
 5. If nothing found → reduce thresholds by 20% → retry from step 1
 6. After 3 threshold reductions with no results → wait and scan again
 """
 
 import sys
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import asyncio
+import functools
+import itertools
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple
 from enum import Enum
 
 # Add parent directory to path
@@ -33,6 +38,66 @@ class StrategyPriority(Enum):
     LOW = 3       # Lower confidence plays
 
 
+# Cascade stages: MEDIUM/LOW only run when CRITICAL/HIGH found too few signals
+_PRIORITY_STAGES = (
+    (StrategyPriority.CRITICAL, StrategyPriority.HIGH),
+    (StrategyPriority.MEDIUM, StrategyPriority.LOW),
+)
+
+# Map strategy name keywords to priorities. The first key (in this order)
+# found in a strategy name wins, so e.g. "lag_arbitrage" matches "arbitrage".
+_PRIORITY_MAP = {
+    # CRITICAL - Risk-free or resolved
+    'arbitrage': StrategyPriority.CRITICAL,
+    'resolved': StrategyPriority.CRITICAL,
+
+    # HIGH - High EV, time-sensitive
+    'overreaction_fade': StrategyPriority.HIGH,
+    'overreaction': StrategyPriority.HIGH,
+    'lag_arbitrage': StrategyPriority.HIGH,
+    'lag_arb': StrategyPriority.HIGH,
+    'wicket_shock': StrategyPriority.HIGH,
+
+    # MEDIUM - Good opportunities
+    'market_only': StrategyPriority.MEDIUM,
+    'draw_decay': StrategyPriority.MEDIUM,
+    'run_reversion': StrategyPriority.MEDIUM,
+
+    # LOW - Lower confidence
+    'volatility_scalp': StrategyPriority.LOW,
+    'favorite_trap': StrategyPriority.LOW,
+    'liquidity_provision': StrategyPriority.LOW,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _priority_for(strategy_name: str) -> StrategyPriority:
+    """Priority for a canonical strategy name (memoized; names are few and fixed)."""
+    for key, priority in _PRIORITY_MAP.items():
+        if key in strategy_name:
+            return priority
+    return StrategyPriority.MEDIUM  # Default
+
+
+_NO_ATTR = object()  # getattr default that no real attribute value can equal
+
+# TradeSignal fields copied into signal dicts, read in one C-level call
+_SIGNAL_FIELDS = (
+    'strategy', 'signal_type', 'market_id', 'market_question', 'sport',
+    'entry_price', 'target_price', 'stop_loss_price', 'confidence',
+    'size_usd', 'rationale', 'metadata'
+)
+_SIGNAL_GET = operator.attrgetter(*_SIGNAL_FIELDS)
+
+
+def _signal_to_dict(signal: TradeSignal) -> Dict[str, Any]:
+    """Convert a TradeSignal into the dict format the cascade returns."""
+    values = list(_SIGNAL_GET(signal))
+    signal_type = values[1]
+    values[1] = signal_type.value if hasattr(signal_type, 'value') else str(signal_type)
+    return dict(zip(_SIGNAL_FIELDS, values))
+
+
 class DynamicStrategyEngine:
     """
     NEVER STOPS LOOKING FOR OPPORTUNITIES
@@ -66,6 +131,23 @@ class DynamicStrategyEngine:
         self.cascade_enabled = self.config.CASCADE_ENABLED
         self.threshold_decay = self.config.CASCADE_THRESHOLD_DECAY
         self.max_retries = self.config.CASCADE_MAX_RETRIES
+        self.min_signals = self.config.CASCADE_MIN_SIGNALS  # 0 = always scan every tier
+        
+        # Threshold multiplier for each attempt (attempt 0 = 1.0)
+        self._decay_schedule = tuple(self.threshold_decay ** i for i in range(self.max_retries + 1))
+        
+        # Config values read in the scan loops, resolved once
+        self._starting_balance = getattr(self.config, 'STARTING_BALANCE', None)
+        self._debug_mode = getattr(self.config, 'DEBUG_MODE', False)
+        
+        # Strategy analysis is synchronous, CPU-bound and not thread-safe
+        # (strategies keep per-instance state), so it runs on one worker
+        # thread: off the event loop, but never two analyses at once
+        self._scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='strategy-scan')
+        
+        # The arbitrage detector shares no state with the strategies, so it
+        # gets its own worker and can run while a stage is being scanned
+        self._arb_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arbitrage-scan')
         
         # Track performance
         self.cascade_stats = {
@@ -82,7 +164,7 @@ class DynamicStrategyEngine:
         for priority, strategies in self.strategy_priorities.items():
             print(f"   {priority.name}: {len(strategies)} strategies")
     
-    def _categorize_strategies(self, strategies: List[BaseStrategy]) -> Dict[StrategyPriority, List[BaseStrategy]]:
+    def _categorize_strategies(self, strategies: List[BaseStrategy]) -> Dict[StrategyPriority, Tuple[BaseStrategy, ...]]:
         """Categorize strategies by priority level."""
         categorized = {
             StrategyPriority.CRITICAL: [],
@@ -91,43 +173,12 @@ class DynamicStrategyEngine:
             StrategyPriority.LOW: []
         }
         
-        # Map strategy names to priorities
-        priority_map = {
-            # CRITICAL - Risk-free or resolved
-            'arbitrage': StrategyPriority.CRITICAL,
-            'resolved': StrategyPriority.CRITICAL,
-            
-            # HIGH - High EV, time-sensitive
-            'overreaction_fade': StrategyPriority.HIGH,
-            'overreaction': StrategyPriority.HIGH,
-            'lag_arbitrage': StrategyPriority.HIGH,
-            'lag_arb': StrategyPriority.HIGH,
-            'wicket_shock': StrategyPriority.HIGH,
-            
-            # MEDIUM - Good opportunities
-            'market_only': StrategyPriority.MEDIUM,
-            'draw_decay': StrategyPriority.MEDIUM,
-            'run_reversion': StrategyPriority.MEDIUM,
-            
-            # LOW - Lower confidence
-            'volatility_scalp': StrategyPriority.LOW,
-            'favorite_trap': StrategyPriority.LOW,
-            'liquidity_provision': StrategyPriority.LOW,
-        }
-        
         for strategy in strategies:
             strategy_name = strategy.name.lower().replace(' ', '_').replace('-', '_')
-            
-            # Find matching priority
-            priority = StrategyPriority.MEDIUM  # Default
-            for key, pri in priority_map.items():
-                if key in strategy_name:
-                    priority = pri
-                    break
-            
-            categorized[priority].append(strategy)
+            categorized[_priority_for(strategy_name)].append(strategy)
         
-        return categorized
+        # Fixed after init; scans only iterate them
+        return {priority: tuple(bucket) for priority, bucket in categorized.items()}
     
     async def cascade_scan(self, markets: List[Dict], sports_data: Dict = None,
                           events: List[Dict] = None) -> List[Dict[str, Any]]:
@@ -153,36 +204,57 @@ class DynamicStrategyEngine:
         if events is None:
             events = []
         
+        # Match events to markets once per scan rather than per strategy
+        market_events = self._match_events(markets, events)
+        
+        # Per-strategy results, reused by retries within this scan
+        analysis_cache = {}
+        
         # Cascade loop - try multiple times with progressively looser thresholds
         while retry_count <= self.max_retries:
-            attempt_num = retry_count + 1
-            print(f"\n🔄 Cascade Scan (attempt {attempt_num}/{self.max_retries + 1}, threshold multiplier: {current_threshold_multiplier:.2f})")
+            if self._debug_mode:
+                attempt_num = retry_count + 1
+                print(f"\n🔄 Cascade Scan (attempt {attempt_num}/{self.max_retries + 1}, threshold multiplier: {current_threshold_multiplier:.2f})")
             
-            # Phase 1: CRITICAL strategies (arbitrage, etc.)
-            if self.arbitrage_detector:
-                arb_signals = await self._scan_arbitrage(markets)
-                if arb_signals:
-                    all_signals.extend(arb_signals)
-                    print(f"🎯 CRITICAL: Found {len(arb_signals)} arbitrage opportunities")
+            # Phase 1: CRITICAL strategies (arbitrage, etc.) run on their own
+            # worker alongside the first priority stage; their signals still
+            # come first
+            arb_scan = self._scan_arbitrage(markets) if self.arbitrage_detector else None
             
-            # Phase 2: Try each priority level
-            for priority in [StrategyPriority.CRITICAL, StrategyPriority.HIGH, 
-                           StrategyPriority.MEDIUM, StrategyPriority.LOW]:
-                
-                strategies = self.strategy_priorities[priority]
-                if not strategies:
-                    continue
+            # Phase 2: Scan priority levels stage by stage (levels within a
+            # stage are independent, so they run together and are reported in
+            # priority order)
+            for stage_num, stage in enumerate(_PRIORITY_STAGES):
+                # Lower tiers only run if the top tiers came up short
+                if stage_num > 0 and 0 < self.min_signals <= len(all_signals):
+                    if self._debug_mode:
+                        print(f"⏩ Cascade: {len(all_signals)} signals from top priorities, skipping lower tiers")
+                    break
                 
-                priority_signals = await self._scan_priority_level(
-                    priority, strategies, markets, sports_data, events,
-                    current_threshold_multiplier
+                stage_scan = self._scan_stage(
+                    stage, markets, sports_data, market_events,
+                    current_threshold_multiplier, analysis_cache
                 )
+                if arb_scan is not None:
+                    arb_signals, level_results = await asyncio.gather(arb_scan, stage_scan)
+                    arb_scan = None
+                    if arb_signals:
+                        all_signals.extend(arb_signals)
+                        if self._debug_mode:
+                            print(f"🎯 CRITICAL: Found {len(arb_signals)} arbitrage opportunities")
+                else:
+                    level_results = await stage_scan
                 
-                if priority_signals:
+                for priority, strategies, priority_signals in level_results:
                     all_signals.extend(priority_signals)
-                    print(f"✅ {priority.name}: Found {len(priority_signals)} signals from {len(strategies)} strategies")
-                else:
-                    print(f"🔄 {priority.name}: No signals from {len(strategies)} strategies, trying next priority...")
+                    
+                    # Per-tier progress is debug output; the summary below always prints
+                    if not self._debug_mode:
+                        continue
+                    if priority_signals:
+                        print(f"✅ {priority.name}: Found {len(priority_signals)} signals from {len(strategies)} strategies")
+                    else:
+                        print(f"🔄 {priority.name}: No signals from {len(strategies)} strategies, trying next priority...")
             
             # If we found signals, return them
             if all_signals:
@@ -194,65 +266,85 @@ class DynamicStrategyEngine:
             if retry_count < self.max_retries:
                 retry_count += 1
                 self.cascade_stats['retries_needed'] += 1
-                current_threshold_multiplier *= self.threshold_decay
+                current_threshold_multiplier = self._decay_schedule[retry_count]
                 self.cascade_stats['threshold_reductions'] += 1
                 
-                print(f"🔄 Cascade: No signals found, reducing thresholds by {(1-self.threshold_decay)*100:.0f}%...")
+                if self._debug_mode:
+                    print(f"🔄 Cascade: No signals found, reducing thresholds by {(1-self.threshold_decay)*100:.0f}%...")
             else:
                 print(f"⚠️ Cascade: No opportunities found after {self.max_retries} retries")
                 break
         
         return all_signals
     
+    async def _scan_stage(self, stage: Tuple[StrategyPriority, ...], markets: List[Dict],
+                          sports_data: Dict, market_events: List,
+                          threshold_multiplier: float, analysis_cache: Dict) -> List[Tuple]:
+        """Scan the non-empty priority levels of a stage one after another, in priority order."""
+        results = []
+        for priority in stage:
+            strategies = self.strategy_priorities[priority]
+            if not strategies:
+                continue
+            signals = await self._scan_priority_level(
+                priority, strategies, markets, sports_data, market_events,
+                threshold_multiplier, analysis_cache
+            )
+            results.append((priority, strategies, signals))
+        return results
+    
     async def _scan_arbitrage(self, markets: List[Dict]) -> List[Dict[str, Any]]:
         """Scan for arbitrage opportunities."""
         if not self.arbitrage_detector:
             return []
         
-        # Get available balance if possible
-        available_balance = None
-        try:
-            available_balance = self.config.STARTING_BALANCE
-        except:
-            pass
+        available_balance = self._starting_balance
         
-        # Scan markets
-        opportunities = self.arbitrage_detector.scan_markets(markets, available_balance)
+        # Scan markets off the event loop
+        loop = asyncio.get_running_loop()
+        opportunities = await loop.run_in_executor(
+            self._arb_pool,
+            lambda: list(self.arbitrage_detector.scan_markets(markets, available_balance))
+        )
         
         # Convert to signal format
-        signals = []
-        for opp in opportunities:
-            signal = {
-                'strategy': 'Arbitrage',
-                'signal_type': 'BUY',
-                'market_id': opp.market_id,
-                'market_question': opp.market_question,
-                'sport': 'unknown',
-                'entry_price': opp.yes_price,
-                'target_price': 1.0,
-                'stop_loss_price': opp.yes_price * 0.95,  # Minimal stop
-                'confidence': 1.0,  # Arbitrage is 100% confident
-                'size_usd': opp.optimal_size_usd,
-                'rationale': opp.rationale,
-                'metadata': {
-                    'opportunity_type': opp.opportunity_type,
-                    'edge_cents': opp.edge_cents,
-                    'yes_price': opp.yes_price,
-                    'no_price': opp.no_price
-                }
-            }
-            signals.append(signal)
-            
-            # Track success
-            self._record_strategy_success('Arbitrage')
+        signals = [self._opportunity_to_signal(opp) for opp in opportunities]
+        
+        # Track success
+        if signals:
+            self._record_strategy_success('Arbitrage', len(signals))
         
         return signals
     
+    @staticmethod
+    def _opportunity_to_signal(opp) -> Dict[str, Any]:
+        """Convert an ArbitrageOpportunity into the cascade's signal format."""
+        return {
+            'strategy': 'Arbitrage',
+            'signal_type': 'BUY',
+            'market_id': opp.market_id,
+            'market_question': opp.market_question,
+            'sport': 'unknown',
+            'entry_price': opp.yes_price,
+            'target_price': 1.0,
+            'stop_loss_price': opp.yes_price * 0.95,  # Minimal stop
+            'confidence': 1.0,  # Arbitrage is 100% confident
+            'size_usd': opp.optimal_size_usd,
+            'rationale': opp.rationale,
+            'metadata': {
+                'opportunity_type': opp.opportunity_type,
+                'edge_cents': opp.edge_cents,
+                'yes_price': opp.yes_price,
+                'no_price': opp.no_price
+            }
+        }
+    
     async def _scan_priority_level(self, priority: StrategyPriority, 
-                                   strategies: List[BaseStrategy],
+                                   strategies: Tuple[BaseStrategy, ...],
                                    markets: List[Dict], sports_data: Dict,
-                                   events: List[Dict],
-                                   threshold_multiplier: float) -> List[Dict[str, Any]]:
+                                   market_events: List,
+                                   threshold_multiplier: float,
+                                   analysis_cache: Dict = None) -> List[Dict[str, Any]]:
         """
         Scan all strategies at a given priority level.
         
@@ -261,82 +353,165 @@ class DynamicStrategyEngine:
             strategies: List of strategies at this level
             markets: Markets to scan
             sports_data: Sports data
-            events: Recent events
+            market_events: Matched event dict per market (see _match_events)
             threshold_multiplier: Threshold adjustment multiplier
+            analysis_cache: Strategy -> signals already computed for these
+                markets during this cascade scan (filled in here)
         
         Returns:
             List of signals found
         """
-        signals = []
+        if analysis_cache is None:
+            analysis_cache = {}
         
-        for strategy in strategies:
-            if not strategy.enabled:
+        loop = asyncio.get_running_loop()
+        active = [strategy for strategy in strategies if strategy.enabled]
+        
+        # Strategies don't take thresholds yet, so a retry would reproduce the
+        # same analysis; only strategies not yet run in this scan execute
+        runnable = []
+        for strategy in active:
+            if strategy in analysis_cache:
                 continue
+            try:
+                self._strategy_multiplier(strategy, threshold_multiplier)
+            except Exception as e:
+                if self._debug_mode:
+                    print(f"⚠️ Strategy {strategy.name} error: {e}")
+                continue
+            runnable.append(strategy)
+        
+        if runnable:
+            # One executor call per level keeps the event loop responsive;
+            # every strategy sees a market before the scan moves on
+            sport_filters = [getattr(strategy, 'sports', None) for strategy in runnable]
+            found = await loop.run_in_executor(
+                self._scan_pool, self._run_markets,
+                runnable, sport_filters, markets, sports_data, market_events
+            )
+            analysis_cache.update(zip(runnable, found))
+        
+        # One flat list in strategy order, sized once
+        results = [analysis_cache.get(strategy) or () for strategy in active]
+        for strategy, result in zip(active, results):
+            if result:
+                self._record_strategy_success(strategy.name, len(result))
+        
+        return list(itertools.chain.from_iterable(results))
+    
+    def _strategy_multiplier(self, strategy: BaseStrategy, threshold_multiplier: float) -> float:
+        """Combined cascade and adaptive threshold multiplier for a strategy."""
+        # Get adaptive threshold multiplier if available
+        adaptive_multiplier = 1.0
+        if self.adaptive_thresholds:
+            adaptive_multiplier = self.adaptive_thresholds.get_threshold_multiplier(strategy.name)
+        
+        # Apply threshold adjustment (this would need strategy support)
+        # For now, strategies run normally
+        return threshold_multiplier * adaptive_multiplier
+    
+    def _run_markets(self, strategies: List[BaseStrategy], sport_filters: List,
+                     markets: List[Dict], sports_data: Dict,
+                     market_events: List) -> List[List[Dict[str, Any]]]:
+        """
+        Run strategies over markets, market by market (called on the scan
+        pool). Returns one signal list per strategy.
+        """
+        signals = [[] for _ in strategies]
+        plan = list(zip(strategies, sport_filters, signals))
+        
+        # Per-market values are read once and shared by every strategy
+        for market, event_dict in zip(markets, market_events):
+            try:
+                sport = market.get('sport', '')
+            except Exception:
+                sport = None
             
-            # Get adaptive threshold multiplier if available
-            adaptive_multiplier = 1.0
-            if self.adaptive_thresholds:
-                adaptive_multiplier = self.adaptive_thresholds.get_threshold_multiplier(strategy.name)
-            
-            # Combine cascade and adaptive multipliers
-            final_multiplier = threshold_multiplier * adaptive_multiplier
-            
-            # Apply threshold adjustment (this would need strategy support)
-            # For now, we just run the strategy normally
-            
-            for market in markets:
+            for strategy, sports, found in plan:
+                # Markets of other sports would be rejected by analyze() anyway
+                if sports is not None and sport not in sports:
+                    continue
+                
                 try:
-                    # Try to match event to market
-                    event_dict = None
-                    market_question = market.get('question', '').lower()
-                    for event in events:
-                        if hasattr(event, 'team') and event.team.lower() in market_question:
-                            event_dict = {
-                                'event_type': event.event_type.value if hasattr(event, 'event_type') else 'unknown',
-                                'team': event.team if hasattr(event, 'team') else '',
-                                'game_time': event.game_time if hasattr(event, 'game_time') else None,
-                                'details': event.details if hasattr(event, 'details') else {}
-                            }
-                            break
+                    # Markets whose event match failed are skipped, as before
+                    if isinstance(event_dict, Exception):
+                        raise event_dict
                     
                     # Run strategy analysis
                     signal = strategy.analyze(market, sports_data, event_dict)
                     
                     if signal:
                         # Convert to dict if needed
-                        if hasattr(signal, '__dict__'):
-                            signal_dict = {
-                                'strategy': signal.strategy,
-                                'signal_type': signal.signal_type.value if hasattr(signal.signal_type, 'value') else str(signal.signal_type),
-                                'market_id': signal.market_id,
-                                'market_question': signal.market_question,
-                                'sport': signal.sport,
-                                'entry_price': signal.entry_price,
-                                'target_price': signal.target_price,
-                                'stop_loss_price': signal.stop_loss_price,
-                                'confidence': signal.confidence,
-                                'size_usd': signal.size_usd,
-                                'rationale': signal.rationale,
-                                'metadata': signal.metadata if hasattr(signal, 'metadata') else {}
-                            }
+                        if isinstance(signal, dict):
+                            found.append(signal)
                         else:
-                            signal_dict = signal
-                        
-                        signals.append(signal_dict)
-                        self._record_strategy_success(strategy.name)
+                            found.append(_signal_to_dict(signal))
                 
                 except Exception as e:
                     # Silently skip errors to keep cascade going
-                    if self.config.DEBUG_MODE:
+                    if self._debug_mode:
                         print(f"⚠️ Strategy {strategy.name} error: {e}")
         
         return signals
     
-    def _record_strategy_success(self, strategy_name: str):
-        """Record successful signal from a strategy."""
+    def _match_events(self, markets: List[Dict], events: List) -> List:
+        """
+        Find the first event whose team appears in each market's question.
+        
+        Returns one entry per market: the event dict, None when nothing
+        matches, or the exception raised while matching that market.
+        """
+        # First event per lowercased team, in event order
+        teams = []
+        seen = set()
+        event_error = None
+        for event in events:
+            if not hasattr(event, 'team'):
+                continue
+            try:
+                team = event.team.lower()
+            except Exception as e:
+                # Markets not matched by an earlier team hit this error
+                event_error = e
+                break
+            if team not in seen:
+                seen.add(team)
+                try:
+                    event_dict = self._event_to_dict(event)
+                except Exception as e:
+                    event_dict = e  # Fails only the markets this event matches
+                teams.append((team, event_dict))
+        
+        matched = []
+        for market in markets:
+            try:
+                question = market.get('question', '').lower()
+                event_dict = next((ed for team, ed in teams if team in question), None)
+                if event_dict is None and event_error is not None:
+                    event_dict = event_error
+            except Exception as e:
+                event_dict = e
+            matched.append(event_dict)
+        
+        return matched
+    
+    @staticmethod
+    def _event_to_dict(event) -> Dict[str, Any]:
+        """Convert a sports event into the dict strategies receive."""
+        # One getattr per field instead of a hasattr probe plus a second lookup
+        event_type = getattr(event, 'event_type', _NO_ATTR)
+        return {
+            'event_type': 'unknown' if event_type is _NO_ATTR else event_type.value,
+            'team': getattr(event, 'team', ''),
+            'game_time': getattr(event, 'game_time', None),
+            'details': getattr(event, 'details', {})
+        }
+    
+    def _record_strategy_success(self, strategy_name: str, count: int = 1):
+        """Record successful signals from a strategy."""
         if strategy_name not in self.cascade_stats['strategy_success']:
             self.cascade_stats['strategy_success'][strategy_name] = 0
-        self.cascade_stats['strategy_success'][strategy_name] += 1
+        self.cascade_stats['strategy_success'][strategy_name] += count
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cascade engine statistics."""
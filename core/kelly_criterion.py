@@ -12,8 +12,111 @@ Where:
 - f* = fraction of bankroll to bet
 """
 
+import functools
 from typing import Optional
 
+# Numba is optional: the scalar kernels below JIT-compile when it is installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# ═══════════════════════════════════════════════════════════════════
+# NUMERIC KERNELS
+# Plain arithmetic with no exceptions so Numba can compile them; the public
+# functions validate and raise. No fastmath: NaN inputs must compare exactly
+# as they do in Python. min()/max() are spelled out for the same reason.
+# ═══════════════════════════════════════════════════════════════════
+
+def _kelly_bet_size(win_probability: float, odds: float, bankroll: float,
+                    fraction: float, max_bet_percent: float) -> float:
+    """Capped fractional Kelly bet for already-validated inputs."""
+    b = odds - 1  # Net odds (e.g., 2.0 odds = 1.0 net odds)
+    p = win_probability
+    q = 1 - p
+    
+    # Kelly formula: f* = (bp - q) / b
+    kelly_percent = (b * p - q) / b
+    
+    # If Kelly is negative or zero, no bet should be made
+    if kelly_percent <= 0:
+        return 0.0
+    
+    # Apply fractional Kelly, capped at max bet percent
+    kelly_percent *= fraction
+    if max_bet_percent < kelly_percent:
+        kelly_percent = max_bet_percent
+    
+    # Calculate bet size
+    return bankroll * kelly_percent
+
+
+def _edge(price: float, true_prob: float) -> float:
+    """Edge of true_prob against price; 0.0 outside (0, 1)."""
+    if not 0 < price < 1 or not 0 < true_prob < 1:
+        return 0.0
+    
+    odds = 1 / price
+    return (true_prob * odds) - 1
+
+
+def _position_size(confidence: float, market_price: float, bankroll: float,
+                   base_size_percent: float, use_kelly: bool, kelly_fraction: float,
+                   max_position_percent: float) -> float:
+    """optimal_position_size with its Kelly fallbacks expressed as branches."""
+    # Start with base size
+    base_size = bankroll * base_size_percent
+    
+    if not use_kelly:
+        # Simple confidence scaling
+        size = base_size * confidence
+    else:
+        # Estimate true probability from confidence and market price,
+        # clamped to [0.51, 0.95]
+        adjustment = 0.3  # Max 30% adjustment from market price
+        estimated_true_prob = market_price + (confidence - 0.5) * adjustment
+        if not estimated_true_prob < 0.95:
+            estimated_true_prob = 0.95
+        if not estimated_true_prob > 0.51:
+            estimated_true_prob = 0.51
+        
+        # Inputs kelly_from_price would reject fall back to base size
+        if (not 0 < market_price < 1 or not 0 < estimated_true_prob < 1 or
+                bankroll <= 0 or not 0 < kelly_fraction <= 1):
+            size = base_size * confidence
+        else:
+            kelly_size = _kelly_bet_size(
+                estimated_true_prob, 1 / market_price, bankroll,
+                kelly_fraction, max_position_percent
+            )
+            
+            # Blend base size with Kelly size (weighted by confidence)
+            size = base_size * (1 - confidence) + kelly_size * confidence
+    
+    # Apply max position cap
+    max_size = bankroll * max_position_percent
+    if max_size < size:
+        size = max_size
+    
+    return size
+
+
+if NUMBA_AVAILABLE:
+    _kelly_bet_size = njit(cache=True)(_kelly_bet_size)
+    _edge = njit(cache=True)(_edge)
+    _position_size = njit(cache=True)(_position_size)
+    
+    # Compile at import so the first trade signal does not pay for it
+    _position_size(0.5, 0.5, 1000.0, 0.1, True, 0.25, 0.25)
+    _edge(0.5, 0.5)
+
+
+# Market prices sit on a coarse tick grid, so the same (price, true_prob)
+# pairs recur; exact float keys keep results identical to the uncached math
+_cached_edge = functools.lru_cache(maxsize=4096)(_edge)
+
 
 def kelly_bet_size(
     win_probability: float,
@@ -52,28 +155,7 @@ def kelly_bet_size(
     if not 0 < fraction <= 1:
         raise ValueError(f"fraction must be between 0 and 1, got {fraction}")
     
-    # Calculate Kelly percentage
-    b = odds - 1  # Net odds (e.g., 2.0 odds = 1.0 net odds)
-    p = win_probability
-    q = 1 - p
-    
-    # Kelly formula: f* = (bp - q) / b
-    kelly_percent = (b * p - q) / b
-    
-    # If Kelly is negative or zero, no bet should be made
-    if kelly_percent <= 0:
-        return 0.0
-    
-    # Apply fractional Kelly
-    kelly_percent *= fraction
-    
-    # Cap at max bet percent
-    kelly_percent = min(kelly_percent, max_bet_percent)
-    
-    # Calculate bet size
-    bet_size = bankroll * kelly_percent
-    
-    return bet_size
+    return _kelly_bet_size(win_probability, odds, bankroll, fraction, max_bet_percent)
 
 
 def kelly_from_price(
@@ -131,13 +213,7 @@ def calculate_edge(price: float, true_prob: float) -> float:
     Returns:
         Edge as decimal (0.1 = 10% edge)
     """
-    if not 0 < price < 1 or not 0 < true_prob < 1:
-        return 0.0
-    
-    odds = 1 / price
-    edge = (true_prob * odds) - 1
-    
-    return edge
+    return _cached_edge(price, true_prob)
 
 
 def optimal_position_size(
@@ -166,41 +242,60 @@ def optimal_position_size(
     Returns:
         Position size in USD
     """
-    # Start with base size
-    base_size = bankroll * base_size_percent
+    return _position_size(
+        confidence, market_price, bankroll, base_size_percent,
+        bool(use_kelly), kelly_fraction, max_position_percent
+    )
+
+
+def make_position_sizer(
+    use_kelly: bool = True,
+    kelly_fraction: float = 0.25,
+    max_position_percent: float = 0.25
+):
+    """
+    Build optimal_position_size with its sizing settings fixed.
     
-    if not use_kelly:
-        # Simple confidence scaling
-        size = base_size * confidence
-    else:
-        # Estimate true probability from confidence and market price
-        # If confidence is high, assume market is underpricing
-        # Simple heuristic: true_prob = price + (confidence - 0.5) * adjustment
-        adjustment = 0.3  # Max 30% adjustment from market price
-        estimated_true_prob = market_price + (confidence - 0.5) * adjustment
-        estimated_true_prob = max(0.51, min(0.95, estimated_true_prob))  # Clamp to reasonable range
+    Use this when the settings come from config and only the per-signal
+    inputs change; the Kelly/no-Kelly choice is made once here.
+    
+    Returns:
+        sizer(confidence, market_price, bankroll, base_size_percent) -> USD
+    """
+    if not use_kelly or not 0 < kelly_fraction <= 1:
+        # Without (a usable) Kelly every signal gets confidence scaling
+        def sizer(confidence: float, market_price: float, bankroll: float,
+                  base_size_percent: float) -> float:
+            size = bankroll * base_size_percent * confidence
+            max_size = bankroll * max_position_percent
+            return max_size if max_size < size else size
         
-        # Calculate Kelly size
-        try:
-            kelly_size = kelly_from_price(
-                market_price,
-                estimated_true_prob,
-                bankroll,
-                fraction=kelly_fraction,
-                max_bet_percent=max_position_percent
+        return sizer
+    
+    def sizer(confidence: float, market_price: float, bankroll: float,
+              base_size_percent: float) -> float:
+        base_size = bankroll * base_size_percent
+        
+        # Estimated true probability, clamped to [0.51, 0.95]
+        estimated_true_prob = market_price + (confidence - 0.5) * 0.3
+        if not estimated_true_prob < 0.95:
+            estimated_true_prob = 0.95
+        if not estimated_true_prob > 0.51:
+            estimated_true_prob = 0.51
+        
+        if not 0 < market_price < 1 or bankroll <= 0:
+            size = base_size * confidence
+        else:
+            kelly_size = _kelly_bet_size(
+                estimated_true_prob, 1 / market_price, bankroll,
+                kelly_fraction, max_position_percent
             )
-            
-            # Blend base size with Kelly size (weighted by confidence)
             size = base_size * (1 - confidence) + kelly_size * confidence
-        except (ValueError, ZeroDivisionError):
-            # Fall back to base size if Kelly calculation fails
-            size = base_size * confidence
-    
-    # Apply max position cap
-    max_size = bankroll * max_position_percent
-    size = min(size, max_size)
+        
+        max_size = bankroll * max_position_percent
+        return max_size if max_size < size else size
     
-    return size
+    return sizer
 
 
 if __name__ == "__main__":
@@ -5,13 +5,99 @@ Real-time sports data with event detection for trading signals.
 Uses ESPN API (free, no key required) and optional premium APIs.
 """
 
+import functools
+import json
+import re
+import threading
+import time
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from config import Config
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ESPN status names for games in play
+_IN_PROGRESS = 'STATUS_IN_PROGRESS'
+_HALFTIME = 'STATUS_HALFTIME'
+
+# Game clocks: football "78'" / "90'+3'" (leading minute), NBA "2:30" or "45"
+_FOOTBALL_CLOCK = re.compile(r"\s*(\d+)[\d'+]*(?:\s|$)")
+_NBA_CLOCK = re.compile(r"\s*(\d+)(?::(\d+))?\s*")
+
+# Overs in a full match (both innings) per cricket format
+_CRICKET_MAX_OVERS = {'T20': 40, 'ODI': 100, 'Test': 450}
+
+
+def _first_competition(event: Dict) -> Dict:
+    """First competition of an ESPN event, or {} if it lists none."""
+    competitions = event.get('competitions')
+    return competitions[0] if competitions else {}
+
+
+def _home_away(competitors: List[Dict]) -> Tuple[Dict, Dict]:
+    """
+    Home and away competitors in one pass; without homeAway tags the
+    first two competitors are used.
+    """
+    home = away = None
+    for competitor in competitors:
+        side = competitor.get('homeAway')
+        if side == 'home':
+            if home is None:
+                home = competitor
+        elif side == 'away':
+            if away is None:
+                away = competitor
+    return (competitors[0] if home is None else home,
+            competitors[1] if away is None else away)
+
+
+@functools.lru_cache(maxsize=512)
+def _cricket_format(event_name: str) -> str:
+    """T20, ODI or Test from an event name; the same fixtures recur every poll."""
+    name = event_name.lower()
+    if 't20' in name or 'ipl' in name or 'bbl' in name:
+        return 'T20'
+    elif 'odi' in name or 'one day' in name:
+        return 'ODI'
+    elif 'test' in name:
+        return 'Test'
+    return 'T20'  # Default to T20
+
+
+def _iter_live_events(events: List[Dict], allowed: Tuple[str, ...] = (_IN_PROGRESS,)):
+    """
+    Yield (event, competition, competitors, status, status_type) for
+    scoreboard events with two or more competitors whose status name is
+    in `allowed`.
+    """
+    for event in events:
+        competition = _first_competition(event)
+        competitors = competition.get('competitors', [])
+        
+        if len(competitors) < 2:
+            continue
+        
+        status = event.get('status', {})
+        status_type = status.get('type', {})
+        
+        # Only include live games
+        if status_type.get('name') not in allowed:
+            continue
+        
+        yield event, competition, competitors, status, status_type
+
 
 class EventType(Enum):
     """Types of sporting events that trigger trading signals."""
@@ -29,7 +115,7 @@ class EventType(Enum):
     OVER_COMPLETE = 'over_complete'
 
 
-@dataclass
+@dataclass(slots=True)
 class SportEvent:
     """Represents a detected sporting event."""
     event_type: EventType
@@ -55,45 +141,163 @@ class LiveSportsFeed:
     
     ESPN_BASE_URL = "https://site.api.espn.com/apis/site/v2/sports"
     
+    # Scoreboard path and cache key for each live sport
+    LIVE_FEEDS = {
+        'football': ('soccer/scoreboard', 'football_live'),
+        'nba': ('basketball/nba/scoreboard', 'nba_live'),
+        'cricket': ('cricket/scoreboard', 'cricket_live'),
+        'tennis': ('tennis/scoreboard', 'tennis_live'),
+    }
+    
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Sports-Bot/1.0'
         })
         
-        # Cache for rate limiting
-        self.cache = {}
-        self.cache_ttl = 30  # 30 second cache
-        
-        # Previous state for event detection
-        self.previous_state = {}
+        # Keep-alive pool sized for concurrent callers; transient gateway
+        # errors are retried before falling back to "no data"
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2,
+                              status_forcelist=(502, 503, 504), raise_on_status=False)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Scoreboards are fetched in parallel over the session above, so they
+        # share its warm connections and retries
+        self._fetch_pool = ThreadPoolExecutor(max_workers=len(self.LIVE_FEEDS), thread_name_prefix='espn-fetch')
+        
+        # Cache for rate limiting (LRU-bounded; team searches add a key per team)
+        self.cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()  # Fetch threads update the LRU order
+        self.cache_ttl = 30  # 30 second cache (entries stamped with time.monotonic())
+        self.cache_max = 512
+        
+        # Previous state for event detection (LRU-bounded; finished games
+        # stop being refreshed and age out)
+        self.previous_state: OrderedDict = OrderedDict()
+        self.previous_state_max = 2048
+        
+        # Resolve ESPN and open a pooled connection in the background so the
+        # first poll skips the DNS lookup and TLS handshake
+        threading.Thread(target=self._prewarm_connection, daemon=True).start()
+    
+    def _prewarm_connection(self):
+        """Open a keep-alive connection to ESPN; failures are left to the first real fetch."""
+        try:
+            self.session.head(self.ESPN_BASE_URL, timeout=5)
+        except Exception:
+            pass
     
     def _is_cache_valid(self, key: str) -> bool:
-        """Check if cached data is still valid."""
-        if key not in self.cache:
-            return False
-        cached_time = self.cache[key].get('timestamp', datetime.min)
-        return (datetime.now() - cached_time).seconds < self.cache_ttl
+        """Check if cached data is still valid; a valid hit counts as recent use."""
+        with self._cache_lock:
+            entry = self.cache.get(key)
+            if entry is None or not time.monotonic() - entry['timestamp'] < self.cache_ttl:
+                return False
+            self.cache.move_to_end(key)
+            return True
+    
+    def _cache_put(self, cache_key: str, entry: Dict) -> None:
+        """Store a cache entry, evicting the least recently used one when full."""
+        with self._cache_lock:
+            self.cache[cache_key] = entry
+            self.cache.move_to_end(cache_key)
+            while len(self.cache) > self.cache_max:
+                self.cache.popitem(last=False)
+    
+    def _remember_state(self, state_key: str, game: Dict) -> None:
+        """Store a game's latest state, evicting the least recently updated game when full."""
+        self.previous_state[state_key] = game
+        self.previous_state.move_to_end(state_key)
+        while len(self.previous_state) > self.previous_state_max:
+            self.previous_state.popitem(last=False)
     
     def _get_cached_or_fetch(self, url: str, cache_key: str) -> Optional[Dict]:
         """Get from cache or fetch from URL."""
         if self._is_cache_valid(cache_key):
-            return self.cache[cache_key].get('data')
+            return self._cached_data(cache_key)
         
         try:
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                self.cache[cache_key] = {
-                    'data': data,
-                    'timestamp': datetime.now()
-                }
-                return data
+            response = self.session.get(
+                url, timeout=10, headers=self._revalidation_headers(cache_key)
+            )
+            return self._handle_response(response, cache_key)
         except Exception as e:
             print(f"⚠️ Error fetching {cache_key}: {e}")
         
         return None
     
+    def _revalidation_headers(self, cache_key: str) -> Dict[str, str]:
+        """Conditional GET headers for an expired cache entry."""
+        headers = {}
+        entry = self.cache.get(cache_key)
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _handle_response(self, response, cache_key: str) -> Optional[Dict]:
+        """Cache a fresh payload, or on 304 Not Modified keep the cached one."""
+        if response.status_code == 200:
+            data = _json_loads(response.content)
+            self._cache_put(cache_key, {
+                'data': data,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'timestamp': time.monotonic()
+            })
+            return data
+        
+        if response.status_code == 304:
+            # Unchanged since the last download - skip the body and re-parse
+            with self._cache_lock:
+                entry = self.cache.get(cache_key)
+                if entry is not None:
+                    entry['timestamp'] = time.monotonic()
+                    self.cache.move_to_end(cache_key)
+                    return entry.get('data')
+        
+        return None
+    
+    def _cached_data(self, cache_key: str) -> Optional[Dict]:
+        """Cached payload for a key, or None if it was evicted meanwhile."""
+        entry = self.cache.get(cache_key)
+        return entry.get('data') if entry is not None else None
+    
+    def _live_feed(self, sport: str):
+        """URL and cache key of a sport's live scoreboard."""
+        path, cache_key = self.LIVE_FEEDS[sport]
+        return f"{self.ESPN_BASE_URL}/{path}", cache_key
+    
+    def _fetch_live_data(self, sports) -> Dict[str, Optional[Dict]]:
+        """
+        Get the live scoreboards for `sports`, fetching the uncached ones
+        concurrently on the fetch pool.
+        """
+        data = {}
+        stale = []
+        for sport in sports:
+            url, cache_key = self._live_feed(sport)
+            if self._is_cache_valid(cache_key):
+                data[sport] = self._cached_data(cache_key)
+            else:
+                stale.append((sport, url, cache_key))
+        
+        if stale:
+            futures = [
+                self._fetch_pool.submit(self._get_cached_or_fetch, url, cache_key)
+                for _, url, cache_key in stale
+            ]
+            for (sport, _, _), future in zip(stale, futures):
+                data[sport] = future.result()
+        
+        return data
+    
     # ═══════════════════════════════════════════════════════════════
     # FOOTBALL (SOCCER)
     # ═══════════════════════════════════════════════════════════════
@@ -107,31 +311,20 @@ class LiveSportsFeed:
         - Status (in_progress, halftime, etc.)
         - Competition info
         """
-        url = f"{self.ESPN_BASE_URL}/soccer/scoreboard"
-        data = self._get_cached_or_fetch(url, 'football_live')
-        
+        return self._parse_live_football(self._get_cached_or_fetch(*self._live_feed('football')))
+    
+    def _parse_live_football(self, data: Optional[Dict]) -> List[Dict[str, Any]]:
+        """Extract live football games from a scoreboard payload."""
         if not data:
             return []
         
         games = []
         
         for league in data.get('leagues', []):
-            for event in league.get('events', []):
-                competition = event.get('competitions', [{}])[0]
-                competitors = competition.get('competitors', [])
-                
-                if len(competitors) < 2:
-                    continue
-                
-                status = event.get('status', {})
-                
-                # Only include live games
-                if status.get('type', {}).get('name') != 'STATUS_IN_PROGRESS':
-                    if status.get('type', {}).get('name') != 'STATUS_HALFTIME':
-                        continue
-                
-                home = next((c for c in competitors if c.get('homeAway') == 'home'), competitors[0])
-                away = next((c for c in competitors if c.get('homeAway') == 'away'), competitors[1])
+            live = _iter_live_events(league.get('events', []), (_IN_PROGRESS, _HALFTIME))
+            for event, _, competitors, status, status_type in live:
+                status_name = status_type.get('name')
+                home, away = _home_away(competitors)
                 
                 game = {
                     'game_id': event.get('id'),
@@ -143,8 +336,8 @@ class LiveSportsFeed:
                     'away_score': int(away.get('score', 0)),
                     'game_time': status.get('displayClock', '0\''),
                     'period': status.get('period', 1),
-                    'status': status.get('type', {}).get('name', 'UNKNOWN'),
-                    'is_halftime': status.get('type', {}).get('name') == 'STATUS_HALFTIME',
+                    'status': status_name,
+                    'is_halftime': status_name == _HALFTIME,
                     'completion_percent': self._get_football_completion(status)
                 }
                 games.append(game)
@@ -154,12 +347,12 @@ class LiveSportsFeed:
     def _get_football_completion(self, status: Dict) -> float:
         """Calculate game completion percentage for football."""
         try:
-            clock = status.get('displayClock', "0'")
-            minute = int(clock.replace("'", "").replace("+", "").split()[0])
+            # Stoppage time ("+3'") is ignored; the cap covers it
+            minute = int(_FOOTBALL_CLOCK.match(status.get('displayClock', "0'")).group(1))
             
             # Standard 90 minutes + injury time
             return min(100, (minute / 90) * 100)
-        except:
+        except (AttributeError, TypeError):
             return 50
     
     def detect_football_events(self, games: List[Dict]) -> List[SportEvent]:
@@ -172,10 +365,12 @@ class LiveSportsFeed:
         - Half time
         """
         events = []
+        now = datetime.now()  # One timestamp for everything seen in this poll
         
         for game in games:
             game_id = game['game_id']
-            prev = self.previous_state.get(f"football_{game_id}", {})
+            state_key = f"football_{game_id}"
+            prev = self.previous_state.get(state_key, {})
             
             # Detect goals
             home_score = game['home_score']
@@ -190,7 +385,7 @@ class LiveSportsFeed:
                     game_id=game_id,
                     team=game['home_team'],
                     player=None,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     game_time=game['game_time'],
                     details={
                         'score': f"{home_score}-{away_score}",
@@ -206,7 +401,7 @@ class LiveSportsFeed:
                     game_id=game_id,
                     team=game['away_team'],
                     player=None,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     game_time=game['game_time'],
                     details={
                         'score': f"{home_score}-{away_score}",
@@ -223,13 +418,13 @@ class LiveSportsFeed:
                     game_id=game_id,
                     team='',
                     player=None,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     game_time="HT",
                     details={'score': f"{home_score}-{away_score}"}
                 ))
             
             # Update previous state
-            self.previous_state[f"football_{game_id}"] = game
+            self._remember_state(state_key, game)
         
         return events
     
@@ -245,29 +440,17 @@ class LiveSportsFeed:
         - Teams, scores, quarter, time remaining
         - Recent scoring runs
         """
-        url = f"{self.ESPN_BASE_URL}/basketball/nba/scoreboard"
-        data = self._get_cached_or_fetch(url, 'nba_live')
-        
+        return self._parse_live_nba(self._get_cached_or_fetch(*self._live_feed('nba')))
+    
+    def _parse_live_nba(self, data: Optional[Dict]) -> List[Dict[str, Any]]:
+        """Extract live NBA games from a scoreboard payload."""
         if not data:
             return []
         
         games = []
         
-        for event in data.get('events', []):
-            competition = event.get('competitions', [{}])[0]
-            competitors = competition.get('competitors', [])
-            
-            if len(competitors) < 2:
-                continue
-            
-            status = event.get('status', {})
-            
-            # Only include live games
-            if status.get('type', {}).get('name') != 'STATUS_IN_PROGRESS':
-                continue
-            
-            home = next((c for c in competitors if c.get('homeAway') == 'home'), competitors[0])
-            away = next((c for c in competitors if c.get('homeAway') == 'away'), competitors[1])
+        for event, _, competitors, status, _ in _iter_live_events(data.get('events', [])):
+            home, away = _home_away(competitors)
             
             home_score = int(home.get('score', 0))
             away_score = int(away.get('score', 0))
@@ -296,9 +479,9 @@ class LiveSportsFeed:
             clock = status.get('displayClock', '12:00')
             
             # Parse time remaining in quarter
-            parts = clock.split(':')
-            minutes = int(parts[0])
-            seconds = int(parts[1]) if len(parts) > 1 else 0
+            match = _NBA_CLOCK.fullmatch(clock)
+            minutes = int(match.group(1))
+            seconds = int(match.group(2) or 0)
             time_remaining = minutes + seconds / 60
             
             # Each quarter is 12 minutes, 4 quarters total
@@ -307,7 +490,7 @@ class LiveSportsFeed:
             total_elapsed = completed_quarters + current_quarter_elapsed
             
             return (total_elapsed / 48) * 100
-        except:
+        except (AttributeError, TypeError):
             return 50
     
     def detect_nba_events(self, games: List[Dict]) -> List[SportEvent]:
@@ -320,10 +503,12 @@ class LiveSportsFeed:
         - Large lead changes
         """
         events = []
+        now = datetime.now()
         
         for game in games:
             game_id = game['game_id']
-            prev = self.previous_state.get(f"nba_{game_id}", {})
+            state_key = f"nba_{game_id}"
+            prev = self.previous_state.get(state_key, {})
             
             # Detect scoring run (10+ points in last check)
             home_change = game['home_score'] - prev.get('home_score', game['home_score'])
@@ -337,7 +522,7 @@ class LiveSportsFeed:
                     game_id=game_id,
                     team=game['home_team'],
                     player=None,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     game_time=f"Q{game['quarter']} {game['time_remaining']}",
                     details={
                         'run_points': home_change,
@@ -353,7 +538,7 @@ class LiveSportsFeed:
                     game_id=game_id,
                     team=game['away_team'],
                     player=None,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     game_time=f"Q{game['quarter']} {game['time_remaining']}",
                     details={
                         'run_points': away_change,
@@ -370,7 +555,7 @@ class LiveSportsFeed:
                     game_id=game_id,
                     team='',
                     player=None,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     game_time=f"End Q{prev.get('quarter', game['quarter'] - 1)}",
                     details={
                         'home_score': game['home_score'],
@@ -378,7 +563,7 @@ class LiveSportsFeed:
                     }
                 ))
             
-            self.previous_state[f"nba_{game_id}"] = game
+            self._remember_state(state_key, game)
         
         return events
     
@@ -394,42 +579,32 @@ class LiveSportsFeed:
         - Teams, scores, overs, wickets
         - Run rate, required rate
         """
-        url = f"{self.ESPN_BASE_URL}/cricket/scoreboard"
-        data = self._get_cached_or_fetch(url, 'cricket_live')
-        
+        return self._parse_live_cricket(self._get_cached_or_fetch(*self._live_feed('cricket')))
+    
+    def _parse_live_cricket(self, data: Optional[Dict]) -> List[Dict[str, Any]]:
+        """Extract live cricket games from a scoreboard payload."""
         if not data:
             return []
         
         games = []
         
-        for event in data.get('events', []):
-            competition = event.get('competitions', [{}])[0]
-            competitors = competition.get('competitors', [])
-            
-            if len(competitors) < 2:
-                continue
-            
-            status = event.get('status', {})
-            
-            # Only include live games
-            if status.get('type', {}).get('name') != 'STATUS_IN_PROGRESS':
-                continue
-            
+        for event, competition, competitors, status, status_type in _iter_live_events(data.get('events', [])):
+            format_type = self._detect_cricket_format(event)
             team1 = competitors[0]
             team2 = competitors[1]
             
             game = {
                 'game_id': event.get('id'),
                 'sport': 'cricket',
-                'format': self._detect_cricket_format(event),
+                'format': format_type,
                 'team1_name': team1.get('team', {}).get('name', 'Unknown'),
                 'team2_name': team2.get('team', {}).get('name', 'Unknown'),
                 'batting_team': self._get_batting_team(competition),
                 'current_score': self._parse_cricket_score(team1, team2),
                 'overs': status.get('period', 0),
                 'wickets': self._get_wickets(team1, team2),
-                'status_text': status.get('type', {}).get('detail', ''),
-                'completion_percent': self._get_cricket_completion(event)
+                'status_text': status_type.get('detail', ''),
+                'completion_percent': self._get_cricket_completion(event, format_type)
             }
             games.append(game)
         
@@ -437,14 +612,7 @@ class LiveSportsFeed:
     
     def _detect_cricket_format(self, event: Dict) -> str:
         """Detect T20, ODI, or Test format."""
-        name = event.get('name', '').lower()
-        if 't20' in name or 'ipl' in name or 'bbl' in name:
-            return 'T20'
-        elif 'odi' in name or 'one day' in name:
-            return 'ODI'
-        elif 'test' in name:
-            return 'Test'
-        return 'T20'  # Default to T20
+        return _cricket_format(event.get('name', ''))
     
     def _get_batting_team(self, competition: Dict) -> str:
         """Get currently batting team."""
@@ -471,14 +639,14 @@ class LiveSportsFeed:
             pass
         return 0
     
-    def _get_cricket_completion(self, event: Dict) -> float:
+    def _get_cricket_completion(self, event: Dict, format_type: Optional[str] = None) -> float:
         """Calculate completion percentage for cricket."""
-        format_type = self._detect_cricket_format(event)
+        if format_type is None:
+            format_type = self._detect_cricket_format(event)
         status = event.get('status', {})
         overs = status.get('period', 0)
         
-        max_overs = {'T20': 40, 'ODI': 100, 'Test': 450}  # Both innings
-        max_over = max_overs.get(format_type, 40)
+        max_over = _CRICKET_MAX_OVERS.get(format_type, 40)
         
         return min(100, (overs / max_over) * 100)
     
@@ -492,10 +660,12 @@ class LiveSportsFeed:
         - Big overs (10+ runs)
         """
         events = []
+        now = datetime.now()
         
         for game in games:
             game_id = game['game_id']
-            prev = self.previous_state.get(f"cricket_{game_id}", {})
+            state_key = f"cricket_{game_id}"
+            prev = self.previous_state.get(state_key, {})
             
             # Detect wicket
             current_wickets = game.get('wickets', 0)
@@ -508,7 +678,7 @@ class LiveSportsFeed:
                     game_id=game_id,
                     team=game.get('batting_team', 'Unknown'),
                     player=None,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     game_time=f"Over {game['overs']}",
                     details={
                         'wickets_now': current_wickets,
@@ -516,7 +686,7 @@ class LiveSportsFeed:
                     }
                 ))
             
-            self.previous_state[f"cricket_{game_id}"] = game
+            self._remember_state(state_key, game)
         
         return events
     
@@ -526,26 +696,16 @@ class LiveSportsFeed:
     
     def get_live_tennis(self) -> List[Dict[str, Any]]:
         """Get live tennis matches."""
-        url = f"{self.ESPN_BASE_URL}/tennis/scoreboard"
-        data = self._get_cached_or_fetch(url, 'tennis_live')
-        
+        return self._parse_live_tennis(self._get_cached_or_fetch(*self._live_feed('tennis')))
+    
+    def _parse_live_tennis(self, data: Optional[Dict]) -> List[Dict[str, Any]]:
+        """Extract live tennis matches from a scoreboard payload."""
         if not data:
             return []
         
         games = []
         
-        for event in data.get('events', []):
-            competition = event.get('competitions', [{}])[0]
-            competitors = competition.get('competitors', [])
-            
-            if len(competitors) < 2:
-                continue
-            
-            status = event.get('status', {})
-            
-            if status.get('type', {}).get('name') != 'STATUS_IN_PROGRESS':
-                continue
-            
+        for event, _, competitors, status, status_type in _iter_live_events(data.get('events', [])):
             player1 = competitors[0]
             player2 = competitors[1]
             
@@ -556,7 +716,7 @@ class LiveSportsFeed:
                 'player2': player2.get('athlete', {}).get('displayName', 'Unknown'),
                 'sets': self._parse_tennis_sets(player1, player2),
                 'current_set': status.get('period', 1),
-                'status_text': status.get('type', {}).get('detail', '')
+                'status_text': status_type.get('detail', '')
             }
             games.append(game)
         
@@ -573,28 +733,34 @@ class LiveSportsFeed:
     # UNIFIED INTERFACE
     # ═══════════════════════════════════════════════════════════════
     
-    def get_all_live_games(self) -> Dict[str, List[Dict]]:
-        """Get all live games across all sports."""
+    def _parse_all_live_games(self, data: Dict[str, Optional[Dict]]) -> Dict[str, List[Dict]]:
+        """Extract live games from every sport's scoreboard payload."""
         return {
-            'football': self.get_live_football(),
-            'nba': self.get_live_nba(),
-            'cricket': self.get_live_cricket(),
-            'tennis': self.get_live_tennis()
+            'football': self._parse_live_football(data['football']),
+            'nba': self._parse_live_nba(data['nba']),
+            'cricket': self._parse_live_cricket(data['cricket']),
+            'tennis': self._parse_live_tennis(data['tennis'])
         }
     
+    def get_all_live_games(self) -> Dict[str, List[Dict]]:
+        """Get all live games across all sports, fetching scoreboards concurrently."""
+        return self._parse_all_live_games(self._fetch_live_data(self.LIVE_FEEDS))
+    
     def detect_all_events(self) -> List[SportEvent]:
         """Detect events across all live sports."""
+        data = self._fetch_live_data(('football', 'nba', 'cricket'))
+        return self._detect_events({
+            'football': self._parse_live_football(data['football']),
+            'nba': self._parse_live_nba(data['nba']),
+            'cricket': self._parse_live_cricket(data['cricket'])
+        })
+    
+    def _detect_events(self, all_games: Dict[str, List[Dict]]) -> List[SportEvent]:
+        """Detect events in already-parsed football, NBA and cricket games."""
         events = []
-        
-        football_games = self.get_live_football()
-        events.extend(self.detect_football_events(football_games))
-        
-        nba_games = self.get_live_nba()
-        events.extend(self.detect_nba_events(nba_games))
-        
-        cricket_games = self.get_live_cricket()
-        events.extend(self.detect_cricket_events(cricket_games))
-        
+        events.extend(self.detect_football_events(all_games['football']))
+        events.extend(self.detect_nba_events(all_games['nba']))
+        events.extend(self.detect_cricket_events(all_games['cricket']))
         return events
     
     def find_late_game_opportunities(self, min_completion: float = 75) -> List[Dict]:
@@ -602,8 +768,12 @@ class LiveSportsFeed:
         Find games that are nearly complete with clear leaders.
         Prime candidates for late-game trading strategies.
         """
+        return self._late_game_opportunities(self.get_all_live_games(), min_completion)
+    
+    def _late_game_opportunities(self, all_games: Dict[str, List[Dict]],
+                                 min_completion: float) -> List[Dict]:
+        """Late-game opportunities among already-parsed live games."""
         opportunities = []
-        all_games = self.get_all_live_games()
         
         for sport, games in all_games.items():
             for game in games:
@@ -618,6 +788,20 @@ class LiveSportsFeed:
         
         return opportunities
     
+    def poll(self, min_completion: float = 75) -> Tuple[Dict[str, List[Dict]], List[SportEvent], List[Dict]]:
+        """
+        Fetch every live scoreboard once and derive everything from it.
+        
+        Use this instead of calling get_all_live_games, detect_all_events and
+        find_late_game_opportunities in the same tick.
+        
+        Returns:
+            (all_games, events, late_game_opportunities)
+        """
+        all_games = self.get_all_live_games()
+        events = self._detect_events(all_games)
+        return all_games, events, self._late_game_opportunities(all_games, min_completion)
+    
     # ═══════════════════════════════════════════════════════════════
     # DYNAMIC MARKET-DRIVEN ESPN SEARCH
     # ═══════════════════════════════════════════════════════════════
@@ -634,8 +818,6 @@ class LiveSportsFeed:
         teams = []
         
         # Common patterns
-        import re
-        
         # Pattern: "Team A vs Team B" or "Team A v Team B"
         vs_pattern = r'([A-Z][a-zA-Z\s]+?)\s+(?:vs\.?|v\.?|versus)\s+([A-Z][a-zA-Z\s]+?)(?:\s*[-\?]|$)'
         match = re.search(vs_pattern, question)
@@ -704,14 +886,15 @@ class LiveSportsFeed:
                     if team_lower in name or team_lower in display_name or team_lower in short_name:
                         # Found the team - return game info
                         status = event.get('status', {})
+                        status_type = status.get('type', {})
                         competitors = comp.get('competitors', [])
                         
                         return {
                             'game_id': event.get('id'),
                             'found_team': team_name,
                             'sport': sport,
-                            'is_live': status.get('type', {}).get('name') == 'STATUS_IN_PROGRESS',
-                            'status': status.get('type', {}).get('description', 'Unknown'),
+                            'is_live': status_type.get('name') == _IN_PROGRESS,
+                            'status': status_type.get('description', 'Unknown'),
                             'home_team': competitors[0].get('team', {}).get('name') if competitors else 'Unknown',
                             'away_team': competitors[1].get('team', {}).get('name') if len(competitors) > 1 else 'Unknown',
                             'home_score': int(competitors[0].get('score', 0)) if competitors else 0,
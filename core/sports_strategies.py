@@ -27,7 +27,7 @@ class SignalType(Enum):
     EXIT = 'EXIT'
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     """Represents a trading signal from a strategy."""
     strategy: str
@@ -72,6 +72,10 @@ class TradeSignal:
 class BaseStrategy(ABC):
     """Base class for all trading strategies."""
     
+    # Sports whose markets this strategy can trade (None = any). Engines
+    # skip markets of other sports without calling analyze().
+    sports: Optional[Tuple[str, ...]] = None
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
@@ -227,6 +231,8 @@ class DrawDecayStrategy(BaseStrategy):
     Expected hold: 10-30 minutes
     """
     
+    sports = ('football',)
+    
     def __init__(self):
         super().__init__(
             name="Draw Decay",
@@ -340,6 +346,8 @@ class RunReversionStrategy(BaseStrategy):
     Expected hold: 5-10 minutes (1-2 quarters worth)
     """
     
+    sports = ('nba',)
+    
     def __init__(self):
         super().__init__(
             name="Run Reversion",
@@ -435,6 +443,8 @@ class WicketShockStrategy(BaseStrategy):
     Expected hold: 30-60 minutes (several overs)
     """
     
+    sports = ('cricket',)
+    
     def __init__(self):
         super().__init__(
             name="Wicket Shock",
@@ -861,7 +871,6 @@ class MarketOnlyStrategy(BaseStrategy):
                 event: Optional[Dict] = None) -> Optional[TradeSignal]:
         
         current_price = market.get('current_price', 0.5)
-        question = market.get('question', '').lower()
         
         # Skip if price is exactly 0.5 (default/unknown)
         if current_price == 0.5:
@@ -891,7 +900,9 @@ class MarketOnlyStrategy(BaseStrategy):
         # Strategy 2: Underdogs (<25%) - BUY for asymmetric risk
         # Low probability events are often underpriced
         if current_price <= Config.MARKET_ONLY_UNDERDOG_THRESHOLD and current_price > 0.03:
-            # Only if it's a "win" market (not weird derivatives)
+            # Only if it's a "win" market (not weird derivatives); the
+            # question is only lowercased for markets that reach this check
+            question = market.get('question', '').lower()
             if 'win' in question or 'beat' in question or 'defeat' in question or market.get('sport'):
                 return TradeSignal(
                     strategy=self.name,
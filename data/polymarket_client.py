@@ -524,7 +524,7 @@ class PolymarketClient:
             
             if sports_series:
                 # Get priority sports from config
-                priority_sports = Config.PRIORITY_SPORTS
+                priority_sports = Config.PRIORITY_SPORTS_ORDER
                 
                 print(f"🎯 Priority sports: {', '.join(priority_sports)}")
                 
@@ -0,0 +1,74 @@
+"""Regression checks for settings loading and validation."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import config  # noqa: E402
+
+
+def _run(script: str, config_file: str = None, check: bool = True) -> subprocess.CompletedProcess:
+    """Run script in a fresh interpreter so no settings class is loaded yet."""
+    env = {k: v for k, v in os.environ.items()
+           if k not in ('TAKE_PROFIT_PERCENT', 'MAX_OPEN_POSITIONS', 'AGGRESSIVE_MODE', 'CONFIG_FILE')}
+    if config_file:
+        env['CONFIG_FILE'] = config_file
+    return subprocess.run(
+        [sys.executable, '-c', script], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=check
+    )
+
+
+def _read(script: str) -> list:
+    return _run(script).stdout.split()
+
+
+def test_aggressive_overrides_after_config_loaded():
+    out = _read(
+        "from config import Config; Config.TAKE_PROFIT_PERCENT\n"
+        "from config_aggressive import AggressiveConfig as A\n"
+        "print(A.TAKE_PROFIT_PERCENT, A.MAX_OPEN_POSITIONS, A.AGGRESSIVE_MODE, Config.TAKE_PROFIT_PERCENT)"
+    )
+    assert out == ['50.0', '20', 'True', '8.0']
+
+
+def test_aggressive_overrides_before_config_loaded():
+    out = _read(
+        "from config_aggressive import AggressiveConfig as A\n"
+        "from config import Config\n"
+        "print(A.TAKE_PROFIT_PERCENT, A.MAX_OPEN_POSITIONS, A.AGGRESSIVE_MODE, Config.TAKE_PROFIT_PERCENT)"
+    )
+    assert out == ['50.0', '20', 'True', '8.0']
+
+
+def test_config_file_rejects_fractional_int(tmp_path):
+    path = tmp_path / 'config.toml'
+    path.write_text('MAX_OPEN_POSITIONS = 2.9\n')
+    result = _run("from config import Config; Config.MAX_OPEN_POSITIONS", str(path), check=False)
+    assert result.returncode != 0
+    assert 'MAX_OPEN_POSITIONS=2.9 must be a whole number' in result.stderr
+
+
+def test_config_file_warns_on_unknown_keys(tmp_path):
+    path = tmp_path / 'config.toml'
+    path.write_text('[trading]\nMAX_OPEN_POSITONS = 3\nMAX_OPEN_POSITIONS = 3.0\nCOMPOUND_THRESHOLD = 1.5\n')
+    out = _run(
+        "from config import Config\n"
+        "from config_aggressive import AggressiveConfig as A\n"
+        "print(Config.MAX_OPEN_POSITIONS, A.COMPOUND_THRESHOLD)",
+        str(path)
+    ).stdout
+    assert out.count('MAX_OPEN_POSITONS') == 1
+    assert 'COMPOUND_THRESHOLD' not in out
+    assert out.split()[-2:] == ['3', '1.5']
+
+
+def test_kelly_fraction_must_be_positive():
+    with pytest.raises(ValueError, match=r'KELLY_FRACTION=0.0 is outside the allowed range \(0, 1\]'):
+        config._check_bounds({'KELLY_FRACTION': 0.0})
+    config._check_bounds({'KELLY_FRACTION': 1.0})
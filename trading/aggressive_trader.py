@@ -21,7 +21,7 @@ from config import Config
 from config_aggressive import AggressiveConfig
 from data.database import Database
 from risk.risk_manager import RiskManager
-from core.kelly_criterion import optimal_position_size
+from core.kelly_criterion import make_position_sizer
 
 
 class AggressiveTrader:
@@ -48,6 +48,13 @@ class AggressiveTrader:
         self.last_compound_equity = self.balance
         self.compound_multiplier = 1.0
         
+        # Sizing settings are fixed for the run; only per-signal inputs vary
+        self._position_sizer = make_position_sizer(
+            use_kelly=AggressiveConfig.USE_KELLY_SIZING,
+            kelly_fraction=AggressiveConfig.KELLY_FRACTION,
+            max_position_percent=AggressiveConfig.MAX_POSITION_PERCENT / 100
+        )
+        
         print(f"⚡ Aggressive Trader initialized with ${self.balance:,.2f}")
         AggressiveConfig.print_status()
     
@@ -174,26 +181,13 @@ class AggressiveTrader:
         base_size_percent = AggressiveConfig.POSITION_SIZE_PERCENT / 100
         base_size_percent *= self.compound_multiplier
         
-        # Apply Kelly Criterion if enabled
-        if AggressiveConfig.USE_KELLY_SIZING:
-            size = optimal_position_size(
-                confidence=signal.get('confidence', 0.5),
-                market_price=signal.get('entry_price', 0.5),
-                bankroll=equity,
-                base_size_percent=base_size_percent,
-                use_kelly=True,
-                kelly_fraction=AggressiveConfig.KELLY_FRACTION,
-                max_position_percent=AggressiveConfig.MAX_POSITION_PERCENT / 100
-            )
-        else:
-            # Simple percentage sizing
-            size = equity * base_size_percent * signal.get('confidence', 0.5)
-        
-        # Cap at max position
-        max_size = equity * (AggressiveConfig.MAX_POSITION_PERCENT / 100)
-        size = min(size, max_size)
-        
-        return size
+        # Kelly Criterion or simple percentage sizing, capped at max position
+        return self._position_sizer(
+            signal.get('confidence', 0.5),
+            signal.get('entry_price', 0.5),
+            equity,
+            base_size_percent
+        )
     
     def _calculate_aggressive_targets(self, entry_price: float, direction: str) -> Tuple[float, float]:
         """Calculate aggressive targets with wider stops."""